@@ -2,7 +2,10 @@
 
 import sys
 import os
+import functools
+import queue
 import subprocess
+import threading
 import numpy as np
 import pygame
 import cv2
@@ -22,27 +25,87 @@ from src.config import (
 TIKTOK_WIDTH = 1080
 TIKTOK_HEIGHT = 1920
 OUTPUT_FILENAME = "tiktok_animation.mp4"
-TEMP_VIDEO_FILENAME = "temp_video_no_audio.avi"
+FRAME_BUFFER_COUNT = 3  # Frames that can be in flight to the writer thread
+X264_PRESET = os.environ.get("TIKTOK_PRESET", "veryfast")  # Flat 2D art needs little motion search
+
+# Cat/UFO art is authored for a 1000px-wide stage
+ART_SCALE = TIKTOK_WIDTH / 1000
+CAT_BASE_SIZE = int(TIKTOK_WIDTH * 0.04)
+CAT_SPRITE_SCALE = 1.5  # Largest scale the cat reaches; sprites only shrink
+
+# Tractor beam cone
+BEAM_COLOR = (150, 255, 150)
+BEAM_TOP_WIDTH = int(TIKTOK_WIDTH * 0.06)
+BEAM_BOTTOM_WIDTH = int(TIKTOK_WIDTH * 0.12)
+
+
+@functools.cache
+def build_sun_glow(sun_radius: int) -> pygame.Surface:
+    """Pre-render the five stacked translucent sun-glow rings into one surface."""
+    glow = pygame.Surface((sun_radius * 4, sun_radius * 4), pygame.SRCALPHA)
+    ring_step = int(sun_radius * 0.2)
+    for i in range(5, 0, -1):
+        # Inner rings sit under every larger ring, so their alpha accumulates
+        layers = 6 - i
+        alpha = round(255 * (1 - (1 - 30 / 255) ** layers))
+        pygame.draw.circle(glow, (255, 255, 0, alpha),
+                          (sun_radius * 2, sun_radius * 2),
+                          sun_radius + i * ring_step)
+    return glow
+
+
+@functools.cache
+def build_cloud_stamp(cloud_size: int) -> pygame.Surface:
+    """Pre-render one cloud, centred at (cloud_size * 2, cloud_size * 2)."""
+    stamp = pygame.Surface((cloud_size * 4, cloud_size * 4), pygame.SRCALPHA)
+    cx = cy = cloud_size * 2
+    pygame.draw.circle(stamp, (255, 255, 255), (cx, cy), cloud_size)
+    pygame.draw.circle(stamp, (255, 255, 255),
+                      (cx + int(cloud_size * 0.8), cy),
+                      int(cloud_size * 0.8))
+    pygame.draw.circle(stamp, (255, 255, 255),
+                      (cx - int(cloud_size * 0.8), cy),
+                      int(cloud_size * 0.8))
+    pygame.draw.circle(stamp, (255, 255, 255),
+                      (cx + int(cloud_size * 0.3), cy - int(cloud_size * 0.5)),
+                      int(cloud_size * 0.6))
+    return stamp
+
+
+@functools.cache
+def build_flower_stamp(bush_radius: int) -> pygame.Surface:
+    """Pre-render one flowering bush, centred at (bush_radius, bush_radius)."""
+    stamp = pygame.Surface((bush_radius * 2 + 1, bush_radius * 2 + 1), pygame.SRCALPHA)
+    fx = fy = bush_radius
+    # Bush
+    pygame.draw.circle(stamp, (60, 120, 60), (fx, fy), bush_radius)
+    # Flowers
+    for i in range(3):
+        flower_x = fx + (i - 1) * int(bush_radius * 0.6)
+        flower_y = fy - int(bush_radius * 0.6)
+        pygame.draw.circle(stamp, (255, 100, 150), (flower_x, flower_y),
+                          int(bush_radius * 0.3))
+        pygame.draw.circle(stamp, (255, 200, 0), (flower_x, flower_y),
+                          int(bush_radius * 0.15))
+    return stamp
 
 
 def draw_park_background(screen: pygame.Surface, width: int, height: int) -> None:
     """Draw a park setting background scaled to TikTok dimensions."""
-    # Sky gradient (light blue to lighter blue)
-    for y in range(height // 2):
-        ratio = y / (height // 2)
-        r = int(135 + (180 - 135) * ratio)
-        g = int(206 + (220 - 206) * ratio)
-        b = int(235 + (245 - 235) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
-    
-    # Grass (green gradient)
     grass_start_y = height // 2
-    for y in range(grass_start_y, height):
-        ratio = (y - grass_start_y) / (height - grass_start_y)
-        r = int(100 + (80 - 100) * ratio)
-        g = int(180 + (150 - 180) * ratio)
-        b = int(100 + (80 - 100) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
+
+    # Sky gradient (light blue to lighter blue) and grass (green gradient),
+    # built as one color column, packed into the surface's native pixel
+    # format and broadcast across the width with one store per pixel
+    sky_ratio = np.arange(grass_start_y)[:, None] / grass_start_y
+    grass_ratio = (np.arange(grass_start_y, height)[:, None] - grass_start_y) / (height - grass_start_y)
+    column = np.concatenate((
+        np.array([135, 206, 235]) + np.array([180 - 135, 220 - 206, 245 - 235]) * sky_ratio,
+        np.array([100, 180, 100]) + np.array([80 - 100, 150 - 180, 80 - 100]) * grass_ratio,
+    )).astype(np.uint8)
+    pixels = pygame.surfarray.pixels2d(screen)
+    pixels[:] = pygame.surfarray.map_array(screen, column[None])
+    del pixels  # Release the surface lock
     
     # Path/walkway (light gray) - scaled
     path_y = height - int(height * 0.33)
@@ -82,29 +145,16 @@ def draw_park_background(screen: pygame.Surface, width: int, height: int) -> Non
     cloud_positions = [(int(width * 0.2), int(height * 0.08)), 
                       (int(width * 0.5), int(height * 0.06)), 
                       (int(width * 0.8), int(height * 0.09))]
-    for cloud_x, cloud_y in cloud_positions:
-        cloud_size = int(width * 0.03)
-        pygame.draw.circle(screen, (255, 255, 255), (cloud_x, cloud_y), cloud_size)
-        pygame.draw.circle(screen, (255, 255, 255), 
-                          (cloud_x + int(cloud_size * 0.8), cloud_y), 
-                          int(cloud_size * 0.8))
-        pygame.draw.circle(screen, (255, 255, 255), 
-                          (cloud_x - int(cloud_size * 0.8), cloud_y), 
-                          int(cloud_size * 0.8))
-        pygame.draw.circle(screen, (255, 255, 255), 
-                          (cloud_x + int(cloud_size * 0.3), cloud_y - int(cloud_size * 0.5)), 
-                          int(cloud_size * 0.6))
+    cloud_size = int(width * 0.03)
+    cloud = build_cloud_stamp(cloud_size)
+    screen.blits([(cloud, (cloud_x - cloud_size * 2, cloud_y - cloud_size * 2))
+                  for cloud_x, cloud_y in cloud_positions], doreturn=False)
     
     # Sun (scaled)
     sun_x, sun_y = int(width * 0.85), int(height * 0.1)
     sun_radius = int(width * 0.03)
     # Sun glow
-    for i in range(5, 0, -1):
-        alpha_surf = pygame.Surface((sun_radius * 4, sun_radius * 4), pygame.SRCALPHA)
-        pygame.draw.circle(alpha_surf, (255, 255, 0, 30), 
-                          (sun_radius * 2, sun_radius * 2), 
-                          sun_radius + i * int(sun_radius * 0.2))
-        screen.blit(alpha_surf, (sun_x - sun_radius * 2, sun_y - sun_radius * 2))
+    screen.blit(build_sun_glow(sun_radius), (sun_x - sun_radius * 2, sun_y - sun_radius * 2))
     # Sun core
     pygame.draw.circle(screen, (255, 255, 0), (sun_x, sun_y), sun_radius)
     pygame.draw.circle(screen, (255, 255, 150), (sun_x, sun_y), int(sun_radius * 0.8))
@@ -114,18 +164,155 @@ def draw_park_background(screen: pygame.Surface, width: int, height: int) -> Non
                        (int(width * 0.35), grass_start_y + int(height * 0.04)),
                        (int(width * 0.58), grass_start_y + int(height * 0.035)), 
                        (int(width * 0.82), grass_start_y + int(height * 0.045))]
-    for fx, fy in flower_positions:
-        # Bush
-        bush_radius = int(width * 0.015)
-        pygame.draw.circle(screen, (60, 120, 60), (fx, fy), bush_radius)
-        # Flowers
-        for i in range(3):
-            flower_x = fx + (i - 1) * int(bush_radius * 0.6)
-            flower_y = fy - int(bush_radius * 0.6)
-            pygame.draw.circle(screen, (255, 100, 150), (flower_x, flower_y), 
-                             int(bush_radius * 0.3))
-            pygame.draw.circle(screen, (255, 200, 0), (flower_x, flower_y), 
-                             int(bush_radius * 0.15))
+    bush_radius = int(width * 0.015)
+    bush = build_flower_stamp(bush_radius)
+    screen.blits([(bush, (fx - bush_radius, fy - bush_radius))
+                  for fx, fy in flower_positions], doreturn=False)
+
+
+@functools.lru_cache(maxsize=1)
+def build_tractor_beam(top_y: float, beam_alpha: float) -> pygame.Surface:
+    """Build the tractor beam cone; reused while the UFO and beam hold steady."""
+    start_y = int(top_y)
+    rows = TIKTOK_HEIGHT - start_y
+
+    # Per-row width and alpha, widening and fading towards the ground
+    progress = (np.arange(start_y, TIKTOK_HEIGHT) - top_y) / (TIKTOK_HEIGHT - top_y)
+    half_widths = (BEAM_TOP_WIDTH + (BEAM_BOTTOM_WIDTH - BEAM_TOP_WIDTH) * progress).astype(np.int32) // 2
+    alphas = (beam_alpha * (1 - progress * 0.5)).astype(np.uint8)
+
+    half_span = BEAM_BOTTOM_WIDTH // 2
+    offsets = np.abs(np.arange(-half_span, half_span + 1))
+    beam = np.empty((rows, offsets.size, 4), dtype=np.uint8)
+    beam[..., :3] = BEAM_COLOR
+    beam[..., 3] = np.where(offsets[None, :] <= half_widths[:, None], alphas[:, None], 0)
+
+    return pygame.image.frombuffer(beam, (offsets.size, rows), "RGBA").convert_alpha()
+
+
+def draw_cat(surface: pygame.Surface, cat_x: int, cat_y: int, cat_scale: float,
+             ears: bool = True, eyes: bool = True) -> None:
+    """Draw the running cat centred on (cat_x, cat_y) at the given scale."""
+    # Scale-dependent sizes, computed once per call
+    k = cat_scale * ART_SCALE
+    outline = max(1, int(2 * cat_scale))
+    cat_width = int(CAT_BASE_SIZE * cat_scale)
+    cat_height = int(CAT_BASE_SIZE * 0.7 * cat_scale)
+    half_width = cat_width // 2
+    half_height = cat_height // 2
+
+    # Cat body (oval)
+    body_rect = pygame.Rect(cat_x - half_width, cat_y - half_height,
+                            cat_width, cat_height)
+    pygame.draw.ellipse(surface, (255, 140, 0), body_rect)
+    pygame.draw.ellipse(surface, (200, 100, 0), body_rect, outline)
+
+    # Cat head (circle)
+    head_size = int(25 * k)
+    head_x = cat_x + cat_width // 3
+    head_y = cat_y - cat_height // 3
+    pygame.draw.circle(surface, (255, 140, 0), (head_x, head_y), head_size)
+    pygame.draw.circle(surface, (200, 100, 0), (head_x, head_y), head_size, outline)
+
+    # Cat ears (triangles)
+    if ears:
+        k5, k12, k15 = int(5 * k), int(12 * k), int(15 * k)
+        # Left ear
+        left_ear = [
+            (head_x - k12, head_y - k15),
+            (head_x - k5, head_y - k5),
+            (head_x - k15, head_y - k5)
+        ]
+        pygame.draw.polygon(surface, (255, 140, 0), left_ear)
+        pygame.draw.polygon(surface, (200, 100, 0), left_ear, outline)
+
+        # Right ear
+        right_ear = [
+            (head_x + k12, head_y - k15),
+            (head_x + k5, head_y - k5),
+            (head_x + k15, head_y - k5)
+        ]
+        pygame.draw.polygon(surface, (255, 140, 0), right_ear)
+        pygame.draw.polygon(surface, (200, 100, 0), right_ear, outline)
+
+        # Eyes (when close)
+        if eyes:
+            eye_size = max(2, int(3 * k))
+            eye_offset = int(6 * k)
+            pygame.draw.circle(surface, (0, 0, 0),
+                               (head_x - eye_offset, head_y), eye_size)
+            pygame.draw.circle(surface, (0, 0, 0),
+                               (head_x + eye_offset, head_y), eye_size)
+
+    # Cat tail (curved line)
+    tail_length = int(30 * k)
+    tail_x = cat_x - half_width
+    pygame.draw.line(surface, (255, 140, 0),
+                     (tail_x, cat_y),
+                     (tail_x - tail_length, cat_y - int(tail_length * 0.7)),
+                     max(2, int(4 * cat_scale)))
+
+    # Legs (simple lines)
+    leg_top = cat_y + half_height
+    leg_bottom = leg_top + int(15 * k)
+    leg_spacing = int(10 * k)
+    leg_width = max(2, int(3 * cat_scale))
+    for i in range(2):
+        leg_x = cat_x - cat_width // 4 + i * leg_spacing
+        pygame.draw.line(surface, (255, 140, 0),
+                         (leg_x, leg_top), (leg_x, leg_bottom), leg_width)
+
+
+def build_cat_sprite(ears: bool, eyes: bool) -> tuple[pygame.Surface, tuple[int, int]]:
+    """Pre-render the cat at CAT_SPRITE_SCALE, returning it with its centre anchor."""
+    k = CAT_SPRITE_SCALE * ART_SCALE
+    cat_width = int(CAT_BASE_SIZE * CAT_SPRITE_SCALE)
+    cat_height = int(CAT_BASE_SIZE * 0.7 * CAT_SPRITE_SCALE)
+    head_size = int(25 * k)
+    tail_length = int(30 * k)
+    left = cat_width // 2 + tail_length + 4
+    right = cat_width // 3 + head_size + 2
+    top = cat_height // 3 + head_size + 2
+    bottom = cat_height // 2 + int(15 * k) + 4
+    sprite = pygame.Surface((left + right, top + bottom), pygame.SRCALPHA)
+    draw_cat(sprite, left, top, CAT_SPRITE_SCALE, ears, eyes)
+    return sprite.convert_alpha(), (left, top)
+
+
+def build_ufo_sprite() -> tuple[pygame.Surface, tuple[int, int]]:
+    """Pre-render the UFO dome, base and window, returning it with its centre anchor."""
+    dome_half_width, dome_top = int(50 * ART_SCALE), int(20 * ART_SCALE)
+    base_half_width, base_top = int(60 * ART_SCALE), int(10 * ART_SCALE)
+    dome_size = (int(100 * ART_SCALE), int(40 * ART_SCALE))
+    base_size = (int(120 * ART_SCALE), int(30 * ART_SCALE))
+    window_radius = int(15 * ART_SCALE)
+
+    # The base disc is the widest part and reaches lowest; the dome sits on top
+    anchor_x, anchor_y = base_half_width, dome_top
+    sprite = pygame.Surface((base_size[0], dome_top + base_top + base_size[1]), pygame.SRCALPHA)
+
+    dome_rect = (anchor_x - dome_half_width, 0, *dome_size)
+    base_rect = (anchor_x - base_half_width, anchor_y + base_top, *base_size)
+
+    # UFO dome (top)
+    pygame.draw.ellipse(sprite, (200, 200, 200), dome_rect)
+    pygame.draw.ellipse(sprite, (150, 150, 150), dome_rect, 2)
+
+    # UFO base (bottom disc)
+    pygame.draw.ellipse(sprite, (180, 180, 180), base_rect)
+    pygame.draw.ellipse(sprite, (100, 100, 100), base_rect, 2)
+
+    # UFO window
+    pygame.draw.circle(sprite, (100, 150, 200), (anchor_x, anchor_y), window_radius)
+    pygame.draw.circle(sprite, (50, 100, 150), (anchor_x, anchor_y), window_radius, 2)
+    return sprite.convert_alpha(), (anchor_x, anchor_y)
+
+
+def build_light_sprite(color: tuple, radius: int) -> pygame.Surface:
+    """Pre-render one UFO light, centred at (radius, radius)."""
+    sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+    return sprite.convert_alpha()
 
 
 def export_tiktok_video() -> None:
@@ -133,19 +320,24 @@ def export_tiktok_video() -> None:
     print("🎬 Starting TikTok video export...")
     print(f"📐 Resolution: {TIKTOK_WIDTH}x{TIKTOK_HEIGHT} (9:16)")
     print(f"🎞️  Frame rate: {FPS} FPS")
-    print("\n💡 TIP: The window will display during export so audio can be captured.")
-    print("   Please don't minimize or interact with the window during export.\n")
-    
-    # Initialize Pygame (with visible window for audio)
+
+    # Initialize Pygame. The display stays hidden, and the mixer uses SDL's
+    # silent driver: frames render faster than real time and this export
+    # records no audio, so the sounds still load but never reach the speakers
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
     pygame.init()
     pygame.mixer.init(
         frequency=AUDIO_SAMPLE_RATE, size=-16, channels=2, buffer=AUDIO_BUFFER_SIZE
     )
 
-    # Set up display with TikTok dimensions
-    screen = pygame.display.set_mode((TIKTOK_WIDTH, TIKTOK_HEIGHT))
+    # Set up a hidden display with TikTok dimensions; frames go to the video
+    # file, so there is no need to present them to a window
+    screen = pygame.display.set_mode((TIKTOK_WIDTH, TIKTOK_HEIGHT), pygame.HIDDEN)
     pygame.display.set_caption("Exporting TikTok Video - DO NOT CLOSE")
-    clock = pygame.time.Clock()
+
+    # Pre-render the static park background once; it is blitted every frame
+    background = pygame.Surface((TIKTOK_WIDTH, TIKTOK_HEIGHT)).convert()
+    draw_park_background(background, TIKTOK_WIDTH, TIKTOK_HEIGHT)
 
     # Initialize audio manager
     audio_manager = AudioManager()
@@ -167,6 +359,14 @@ def export_tiktok_video() -> None:
         print(f"Warning: Could not load meow sound: {e}")
         meow_sound = None
 
+    # Load spaceship sound effect
+    try:
+        spaceship_sound = pygame.mixer.Sound("assets/000_spaceship.wav")
+        print("✓ Loaded spaceship sound effect")
+    except (FileNotFoundError, pygame.error) as e:
+        print(f"Warning: Could not load spaceship sound: {e}")
+        spaceship_sound = None
+
     # Create characters with scaled positions
     char1 = Character(
         x=-50,
@@ -186,25 +386,79 @@ def export_tiktok_video() -> None:
 
     # Initialize animation controller
     animation = AnimationController(char1, char2, audio_manager, walking_sound, 
-                                   collision_sound, meow_sound)
-
-    # Set up video writer for temporary video (no audio yet)
-    fourcc = cv2.VideoWriter_fourcc(*'XVID')
-    out = cv2.VideoWriter(
-        TEMP_VIDEO_FILENAME,
-        fourcc,
-        FPS,
-        (TIKTOK_WIDTH, TIKTOK_HEIGHT)
-    )
-    
-    if not out.isOpened():
-        print("❌ Error: Could not open video writer")
+                                   collision_sound, meow_sound, spaceship_sound)
+
+    # Pipe raw BGR frames straight into ffmpeg, which encodes the final MP4
+    # in a single pass with no intermediate video file. Its stderr goes
+    # straight to the console: nothing reads it until the encode finishes,
+    # so a pipe could fill up and stall ffmpeg
+    cmd = [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 'rawvideo',
+        '-pix_fmt', 'bgr24',
+        '-s', f'{TIKTOK_WIDTH}x{TIKTOK_HEIGHT}',
+        '-r', str(FPS),
+        '-i', '-',
+        '-c:v', 'libx264',
+        '-preset', X264_PRESET,
+        '-tune', 'animation',
+        '-threads', '0',
+        '-crf', '23',
+        '-pix_fmt', 'yuv420p',
+        OUTPUT_FILENAME
+    ]
+    try:
+        encoder = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    except FileNotFoundError:
+        print("❌ Error: ffmpeg not found. Install ffmpeg to export video.")
         pygame.quit()
         sys.exit(1)
-    
-    print("✓ Video writer initialized")
+
+    # Feed ffmpeg from a background thread so the render loop doesn't stall on
+    # the pipe. Preallocated BGR buffers cycle between the free queue and the
+    # pending queue, so a buffer is never refilled while queued.
+    free_buffers = queue.Queue()
+    for _ in range(FRAME_BUFFER_COUNT):
+        free_buffers.put(np.empty((TIKTOK_HEIGHT, TIKTOK_WIDTH, 3), dtype=np.uint8))
+    pending_frames = queue.Queue(maxsize=FRAME_BUFFER_COUNT)
+
+    def write_frames() -> None:
+        while True:
+            frame = pending_frames.get()
+            if frame is None:
+                break
+            try:
+                encoder.stdin.write(memoryview(frame))
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its error is reported after the loop
+            free_buffers.put(frame)
+
+    writer_thread = threading.Thread(target=write_frames, daemon=True)
+    writer_thread.start()
+
+    print("✓ Video encoder started")
     print("🎥 Recording frames...")
-    print("   (Audio is playing - will be added in post-processing)\n")
+    print("   (Video only - no audio is played or recorded)\n")
+
+    # UFO geometry is fixed for the whole export: pre-render the hull and each
+    # light's on/off state once
+    ufo_sprite, (ufo_anchor_x, ufo_anchor_y) = build_ufo_sprite()
+    ufo_light_radius = int(5 * ART_SCALE)
+    ufo_lights_dy = int(20 * ART_SCALE) - ufo_light_radius
+    ufo_light_off = build_light_sprite((100, 100, 100), ufo_light_radius)
+    ufo_lights = [
+        (int(lx * ART_SCALE) - ufo_light_radius, build_light_sprite(color, ufo_light_radius))
+        for lx, color in zip([-40, -20, 0, 20, 40],
+                             [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (255, 0, 255)])
+    ]
+
+    # Cat sprites for each ear/eye detail level, scaled down per frame
+    cat_sprites = {
+        (ears, eyes): build_cat_sprite(ears, eyes)
+        for ears, eyes in [(False, False), (True, False), (True, True)]
+    }
+    cat_frame_key = None
+    cat_frame = None
 
     frame_count = 0
     running = True
@@ -215,8 +469,9 @@ def export_tiktok_video() -> None:
             if event.type == pygame.QUIT:
                 running = False
 
-        # Update animation
-        current_time = pygame.time.get_ticks()
+        # Update animation on a virtual clock driven by the frame index, so the
+        # export runs as fast as it can render and the timing is deterministic
+        current_time = frame_count * 1000 // FPS
         animation.update(current_time)
 
         # Auto-close when animation is finished
@@ -225,220 +480,97 @@ def export_tiktok_video() -> None:
             if animation.finished_time and current_time - animation.finished_time > 1000:
                 running = False
 
-        # Draw park background
-        draw_park_background(screen, TIKTOK_WIDTH, TIKTOK_HEIGHT)
+        # Collect the background and sprite blits, then issue them in one batch
+        frame_blits = [(background, (0, 0))]
 
         # Draw cat if in cat run phase
         if animation.phase == animation.AnimationPhase.CAT_RUN:
             cat_x = int(animation.cat_x)
             cat_y = TIKTOK_HEIGHT - int(TIKTOK_HEIGHT * 0.25)
             cat_scale = animation.cat_scale
-            
-            # Calculate scaled dimensions
-            base_size = int(TIKTOK_WIDTH * 0.04)
-            cat_width = int(base_size * cat_scale)
-            cat_height = int(base_size * 0.7 * cat_scale)
-            
-            # Cat body (oval)
-            body_rect = pygame.Rect(cat_x - cat_width // 2, cat_y - cat_height // 2,
-                                   cat_width, cat_height)
-            pygame.draw.ellipse(screen, (255, 140, 0), body_rect)
-            pygame.draw.ellipse(screen, (200, 100, 0), body_rect, max(1, int(2 * cat_scale)))
-            
-            # Cat head (circle)
-            head_size = int(25 * cat_scale * (TIKTOK_WIDTH / 1000))
-            head_x = cat_x + int(cat_width // 3)
-            head_y = cat_y - int(cat_height // 3)
-            pygame.draw.circle(screen, (255, 140, 0), (head_x, head_y), head_size)
-            pygame.draw.circle(screen, (200, 100, 0), (head_x, head_y), head_size, 
-                             max(1, int(2 * cat_scale)))
-            
-            # Cat ears (triangles)
-            if cat_scale > 0.3:
-                ear_size = int(10 * cat_scale * (TIKTOK_WIDTH / 1000))
-                # Left ear
-                left_ear = [
-                    (head_x - int(12 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                     head_y - int(15 * cat_scale * (TIKTOK_WIDTH / 1000))),
-                    (head_x - int(5 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                     head_y - int(5 * cat_scale * (TIKTOK_WIDTH / 1000))),
-                    (head_x - int(15 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                     head_y - int(5 * cat_scale * (TIKTOK_WIDTH / 1000)))
-                ]
-                pygame.draw.polygon(screen, (255, 140, 0), left_ear)
-                pygame.draw.polygon(screen, (200, 100, 0), left_ear, 
-                                  max(1, int(2 * cat_scale)))
-                
-                # Right ear
-                right_ear = [
-                    (head_x + int(12 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                     head_y - int(15 * cat_scale * (TIKTOK_WIDTH / 1000))),
-                    (head_x + int(5 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                     head_y - int(5 * cat_scale * (TIKTOK_WIDTH / 1000))),
-                    (head_x + int(15 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                     head_y - int(5 * cat_scale * (TIKTOK_WIDTH / 1000)))
-                ]
-                pygame.draw.polygon(screen, (255, 140, 0), right_ear)
-                pygame.draw.polygon(screen, (200, 100, 0), right_ear, 
-                                  max(1, int(2 * cat_scale)))
-                
-                # Eyes (when close)
-                if cat_scale > 0.6:
-                    eye_size = max(2, int(3 * cat_scale * (TIKTOK_WIDTH / 1000)))
-                    pygame.draw.circle(screen, (0, 0, 0),
-                                     (head_x - int(6 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                                      head_y), eye_size)
-                    pygame.draw.circle(screen, (0, 0, 0),
-                                     (head_x + int(6 * cat_scale * (TIKTOK_WIDTH / 1000)), 
-                                      head_y), eye_size)
-            
-            # Cat tail (curved line)
-            tail_length = int(30 * cat_scale * (TIKTOK_WIDTH / 1000))
-            tail_x = cat_x - int(cat_width // 2)
-            tail_y = cat_y
-            pygame.draw.line(screen, (255, 140, 0),
-                           (tail_x, tail_y),
-                           (tail_x - tail_length, tail_y - int(tail_length * 0.7)),
-                           max(2, int(4 * cat_scale)))
-            
-            # Legs (simple lines)
-            leg_length = int(15 * cat_scale * (TIKTOK_WIDTH / 1000))
-            leg_spacing = int(10 * cat_scale * (TIKTOK_WIDTH / 1000))
-            for i in range(2):
-                leg_x = cat_x - int(cat_width // 4) + i * leg_spacing
-                pygame.draw.line(screen, (255, 140, 0),
-                               (leg_x, cat_y + cat_height // 2),
-                               (leg_x, cat_y + cat_height // 2 + leg_length),
-                               max(2, int(3 * cat_scale)))
+
+            # Scale the pre-rendered cat sprite instead of redrawing it
+            ears, eyes = cat_scale > 0.3, cat_scale > 0.6
+            sprite, (anchor_x, anchor_y) = cat_sprites[ears, eyes]
+            ratio = cat_scale / CAT_SPRITE_SCALE
+            size = (max(1, int(sprite.get_width() * ratio)),
+                    max(1, int(sprite.get_height() * ratio)))
+            if cat_frame_key != (size, ears, eyes):
+                cat_frame_key = (size, ears, eyes)
+                cat_frame = pygame.transform.smoothscale(sprite, size)
+            frame_blits.append((cat_frame, (cat_x - int(anchor_x * ratio),
+                                            cat_y - int(anchor_y * ratio))))
 
         # Draw UFO and abduction beam if in abduction phase
         if animation.phase == animation.AnimationPhase.ALIEN_ABDUCTION:
-            # Draw tractor beam
-            if animation.beam_alpha > 0:
-                beam_color = (150, 255, 150, int(animation.beam_alpha))
-                ufo_center_x = int(char2.get_center_x())
-                beam_top_width = int(TIKTOK_WIDTH * 0.06)
-                beam_bottom_width = int(TIKTOK_WIDTH * 0.12)
-                
-                for y in range(int(animation.ufo_y + 40), TIKTOK_HEIGHT):
-                    progress = (y - (animation.ufo_y + 40)) / (TIKTOK_HEIGHT - (animation.ufo_y + 40))
-                    width = int(beam_top_width + (beam_bottom_width - beam_top_width) * progress)
-                    alpha = int(animation.beam_alpha * (1 - progress * 0.5))
-                    pygame.draw.line(screen, (*beam_color[:3], alpha),
-                                   (ufo_center_x - width // 2, y),
-                                   (ufo_center_x + width // 2, y), 2)
-            
-            # Draw UFO (scaled)
             ufo_x = int(char2.get_center_x())
             ufo_y = int(animation.ufo_y)
-            ufo_scale = TIKTOK_WIDTH / 1000
-            
-            # UFO dome (top)
-            pygame.draw.ellipse(screen, (200, 200, 200),
-                              (ufo_x - int(50 * ufo_scale), ufo_y - int(20 * ufo_scale), 
-                               int(100 * ufo_scale), int(40 * ufo_scale)))
-            pygame.draw.ellipse(screen, (150, 150, 150),
-                              (ufo_x - int(50 * ufo_scale), ufo_y - int(20 * ufo_scale), 
-                               int(100 * ufo_scale), int(40 * ufo_scale)), 2)
-            
-            # UFO base (bottom disc)
-            pygame.draw.ellipse(screen, (180, 180, 180),
-                              (ufo_x - int(60 * ufo_scale), ufo_y + int(10 * ufo_scale), 
-                               int(120 * ufo_scale), int(30 * ufo_scale)))
-            pygame.draw.ellipse(screen, (100, 100, 100),
-                              (ufo_x - int(60 * ufo_scale), ufo_y + int(10 * ufo_scale), 
-                               int(120 * ufo_scale), int(30 * ufo_scale)), 2)
-            
+
+            # Draw tractor beam
+            beam_top = animation.ufo_y + 40
+            if animation.beam_alpha > 0 and beam_top < TIKTOK_HEIGHT:
+                frame_blits.append((build_tractor_beam(beam_top, animation.beam_alpha),
+                                    (ufo_x - BEAM_BOTTOM_WIDTH // 2, int(beam_top))))
+
+            # Draw UFO (scaled)
+            frame_blits.append((ufo_sprite, (ufo_x - ufo_anchor_x, ufo_y - ufo_anchor_y)))
+
             # UFO lights
-            light_positions = [-40, -20, 0, 20, 40]
-            for i, lx in enumerate(light_positions):
-                light_color = [(255, 0, 0), (0, 255, 0), (0, 0, 255), 
-                              (255, 255, 0), (255, 0, 255)][i]
-                lx_scaled = int(lx * ufo_scale)
+            lights_y = ufo_y + ufo_lights_dy
+            for i, (lx_offset, light_on) in enumerate(ufo_lights):
                 # Blinking effect
-                if (current_time // 200 + i) % 2 == 0:
-                    pygame.draw.circle(screen, light_color, 
-                                     (ufo_x + lx_scaled, ufo_y + int(20 * ufo_scale)), 
-                                     int(5 * ufo_scale))
-                else:
-                    pygame.draw.circle(screen, (100, 100, 100), 
-                                     (ufo_x + lx_scaled, ufo_y + int(20 * ufo_scale)), 
-                                     int(5 * ufo_scale))
-            
-            # UFO window
-            pygame.draw.circle(screen, (100, 150, 200), (ufo_x, ufo_y), int(15 * ufo_scale))
-            pygame.draw.circle(screen, (50, 100, 150), (ufo_x, ufo_y), int(15 * ufo_scale), 2)
+                light = light_on if (current_time // 200 + i) % 2 == 0 else ufo_light_off
+                frame_blits.append((light, (ufo_x + lx_offset, lights_y)))
+
+        screen.blits(frame_blits, doreturn=False)
 
         # Draw characters
         char1.draw(screen)
         char2.draw(screen)
 
         # Draw dialogue
-        animation.draw_dialogue(screen)
+        animation.draw_dialogue(screen, current_time)
 
-        # Capture frame
-        frame = pygame.surfarray.array3d(screen)
-        frame = np.transpose(frame, (1, 0, 2))
-        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-        out.write(frame)
+        # Capture frame: convert straight from the locked screen pixels into
+        # a reused BGR buffer (swapaxes is a view, cvtColor writes into dst)
+        frame_buffer = free_buffers.get()
+        pixels = pygame.surfarray.pixels3d(screen)
+        cv2.cvtColor(pixels.swapaxes(0, 1), cv2.COLOR_RGB2BGR, dst=frame_buffer)
+        del pixels  # Release the surface lock before drawing again
+        pending_frames.put(frame_buffer)
         
         frame_count += 1
         
         if frame_count % 60 == 0:
             print(f"  Recorded {frame_count} frames ({frame_count // FPS}s)")
 
-        pygame.display.flip()
-        clock.tick(FPS)
-
-    # Release video writer
-    out.release()
+    # Drain the writer thread, then let ffmpeg finish encoding
+    pending_frames.put(None)
+    writer_thread.join()
     pygame.quit()
-    
-    print("\n✓ Video frames saved")
-    print("🎵 Converting to TikTok format with ffmpeg...")
-    
-    # Use ffmpeg to convert to MP4 with proper codec
+
+    print("\n✓ Video frames recorded")
+    print("🎵 Finishing TikTok encode with ffmpeg...")
+
     try:
-        cmd = [
-            'ffmpeg', '-y',
-            '-i', TEMP_VIDEO_FILENAME,
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
-            '-pix_fmt', 'yuv420p',
-            '-r', str(FPS),
-            OUTPUT_FILENAME
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✓ Video converted successfully")
-            # Clean up temp file
-            if os.path.exists(TEMP_VIDEO_FILENAME):
-                os.remove(TEMP_VIDEO_FILENAME)
-        else:
-            print(f"⚠️  ffmpeg conversion had issues: {result.stderr}")
-            print(f"   Temp video saved as: {TEMP_VIDEO_FILENAME}")
-            
-    except FileNotFoundError:
-        print("⚠️  ffmpeg not found. Keeping temp video file.")
-        print(f"   Install ffmpeg or use: {TEMP_VIDEO_FILENAME}")
-    except Exception as e:
-        print(f"⚠️  Error during conversion: {e}")
-        print(f"   Temp video saved as: {TEMP_VIDEO_FILENAME}")
-    
+        encoder.stdin.close()
+    except BrokenPipeError:
+        pass
+    returncode = encoder.wait()
+    if returncode == 0:
+        print("✓ Video converted successfully")
+    else:
+        print(f"⚠️  ffmpeg conversion had issues (exit code {returncode})")
+
     print(f"\n✅ Export complete!")
     print(f"📹 Total frames: {frame_count}")
     print(f"⏱️  Duration: {frame_count / FPS:.2f} seconds")
     print(f"💾 Output file: {OUTPUT_FILENAME}")
     print(f"📏 Resolution: {TIKTOK_WIDTH}x{TIKTOK_HEIGHT} (9:16 aspect ratio)")
     print(f"🎞️  Frame rate: {FPS} FPS")
-    print(f"\n⚠️  NOTE: This export captures video only.")
-    print(f"   To add audio, you can:")
-    print(f"   1. Use screen recording software (QuickTime, OBS, etc.)")
-    print(f"   2. Run main.py and record with audio capture")
-    print(f"   3. Add audio in video editing software")
+    print(f"\n⚠️  NOTE: This export is video only.")
+    print(f"   For a version with synced audio, run export_tiktok_final.py,")
+    print(f"   or add a soundtrack in video editing software")
 
 
 if __name__ == "__main__":
@@ -2,15 +2,17 @@
 
 import sys
 import os
+import functools
+import queue
+import shutil
 import subprocess
 import tempfile
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pygame
 import cv2
-try:
-    from moviepy.editor import VideoFileClip, AudioFileClip, CompositeAudioClip, concatenate_audioclips
-except ImportError:
-    from moviepy import VideoFileClip, AudioFileClip, CompositeAudioClip, concatenate_audioclips
 from pathlib import Path
 
 from src.animation import AnimationController
@@ -35,26 +37,40 @@ CROP_WIDTH = int(SCREEN_HEIGHT * (TIKTOK_WIDTH / TIKTOK_HEIGHT))
 CROP_X = (SCREEN_WIDTH - CROP_WIDTH) // 2
 
 OUTPUT_FILENAME = "tiktok.mp4"
+FRAME_BUFFER_COUNT = 4  # Captured frames that can wait for the encode thread
+CAT_SPRITE_SCALE = 1.5  # Largest scale the cat reaches; sprites only shrink
+MIX_SAMPLE_RATE = 48000  # Matches the assets, so they mix without resampling
+
+# H.264 encoders to try in order; hardware first, libx264 as the fallback
+VIDEO_ENCODERS = [
+    ['-c:v', 'h264_nvenc', '-preset', 'p5', '-tune', 'hq', '-rc', 'vbr', '-cq', '19', '-b:v', '8M'],
+    ['-c:v', 'h264_videotoolbox', '-b:v', '8M'],
+]
+SOFTWARE_ENCODER = ['-c:v', 'libx264', '-preset', 'medium', '-crf', '18']
+
+
+@functools.cache
+def build_sun_glow() -> pygame.Surface:
+    """Pre-render the five stacked translucent sun-glow rings into one surface."""
+    glow = pygame.Surface((100, 100), pygame.SRCALPHA)
+    for i in range(5, 0, -1):
+        # Inner rings sit under every larger ring, so their alpha accumulates
+        alpha = round(255 * (1 - (1 - 30 / 255) ** (6 - i)))
+        pygame.draw.circle(glow, (255, 255, 0, alpha), (50, 50), 30 + i * 5)
+    return glow
 
 
 def draw_park_background(screen: pygame.Surface) -> None:
     """Draw a park setting background."""
-    # Sky gradient
-    for y in range(SCREEN_HEIGHT // 2):
-        ratio = y / (SCREEN_HEIGHT // 2)
-        r = int(135 + (180 - 135) * ratio)
-        g = int(206 + (220 - 206) * ratio)
-        b = int(235 + (245 - 235) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-    
-    # Grass
+    # Sky and grass gradients, built as one color column and broadcast across the width
     grass_start_y = SCREEN_HEIGHT // 2
-    for y in range(grass_start_y, SCREEN_HEIGHT):
-        ratio = (y - grass_start_y) / (SCREEN_HEIGHT - grass_start_y)
-        r = int(100 + (80 - 100) * ratio)
-        g = int(180 + (150 - 180) * ratio)
-        b = int(100 + (80 - 100) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+    sky_ratio = np.arange(grass_start_y)[:, None] / grass_start_y
+    grass_ratio = (np.arange(grass_start_y, SCREEN_HEIGHT)[:, None] - grass_start_y) / (SCREEN_HEIGHT - grass_start_y)
+    column = np.concatenate((
+        np.array([135, 206, 235]) + np.array([180 - 135, 220 - 206, 245 - 235]) * sky_ratio,
+        np.array([100, 180, 100]) + np.array([80 - 100, 150 - 180, 80 - 100]) * grass_ratio,
+    )).astype(np.uint8)
+    pygame.surfarray.blit_array(screen, np.broadcast_to(column, (SCREEN_WIDTH, SCREEN_HEIGHT, 3)))
     
     # Path
     path_y = SCREEN_HEIGHT - 200
@@ -84,10 +100,7 @@ def draw_park_background(screen: pygame.Surface) -> None:
     
     # Sun
     sun_x, sun_y = 700, 100
-    for i in range(5, 0, -1):
-        alpha_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
-        pygame.draw.circle(alpha_surf, (255, 255, 0, 30), (50, 50), 30 + i * 5)
-        screen.blit(alpha_surf, (sun_x - 50, sun_y - 50))
+    screen.blit(build_sun_glow(), (sun_x - 50, sun_y - 50))
     pygame.draw.circle(screen, (255, 255, 0), (sun_x, sun_y), 30)
     pygame.draw.circle(screen, (255, 255, 150), (sun_x, sun_y), 25)
     
@@ -103,11 +116,138 @@ def draw_park_background(screen: pygame.Surface) -> None:
             pygame.draw.circle(screen, (255, 200, 0), (flower_x, flower_y), 2)
 
 
+def draw_cat(surface, cat_x, cat_y, cat_scale, ears=True, eyes=True):
+    """Draw the running cat centred on (cat_x, cat_y) at the given scale."""
+    # Scale-dependent sizes, computed once per call
+    s = cat_scale
+    cat_width, cat_height = int(40 * s), int(40 * 0.7 * s)
+    outline = max(1, int(2 * s))
+    head_size = int(25 * s)
+    e5, e12, e15 = int(5 * s), int(12 * s), int(15 * s)
+    tail_length = int(30 * s)
+    leg_length, leg_spacing = int(15 * s), int(10 * s)
+
+    body_rect = pygame.Rect(cat_x - cat_width // 2, cat_y - cat_height // 2, cat_width, cat_height)
+    pygame.draw.ellipse(surface, (255, 140, 0), body_rect)
+    pygame.draw.ellipse(surface, (200, 100, 0), body_rect, outline)
+
+    head_x = cat_x + cat_width // 3
+    head_y = cat_y - cat_height // 3
+    pygame.draw.circle(surface, (255, 140, 0), (head_x, head_y), head_size)
+    pygame.draw.circle(surface, (200, 100, 0), (head_x, head_y), head_size, outline)
+
+    if ears:
+        left_ear = [(head_x - e12, head_y - e15), (head_x - e5, head_y - e5), (head_x - e15, head_y - e5)]
+        pygame.draw.polygon(surface, (255, 140, 0), left_ear)
+        pygame.draw.polygon(surface, (200, 100, 0), left_ear, outline)
+
+        right_ear = [(head_x + e12, head_y - e15), (head_x + e5, head_y - e5), (head_x + e15, head_y - e5)]
+        pygame.draw.polygon(surface, (255, 140, 0), right_ear)
+        pygame.draw.polygon(surface, (200, 100, 0), right_ear, outline)
+
+        if eyes:
+            eye_size, e6 = max(2, int(3 * s)), int(6 * s)
+            pygame.draw.circle(surface, (0, 0, 0), (head_x - e6, head_y), eye_size)
+            pygame.draw.circle(surface, (0, 0, 0), (head_x + e6, head_y), eye_size)
+
+    tail_x = cat_x - cat_width // 2
+    tail_y = cat_y
+    pygame.draw.line(surface, (255, 140, 0), (tail_x, tail_y),
+                     (tail_x - tail_length, tail_y - int(tail_length * 0.7)), max(2, int(4 * s)))
+
+    leg_top = cat_y + cat_height // 2
+    leg_width = max(2, int(3 * s))
+    for i in range(2):
+        leg_x = cat_x - cat_width // 4 + i * leg_spacing
+        pygame.draw.line(surface, (255, 140, 0), (leg_x, leg_top), (leg_x, leg_top + leg_length), leg_width)
+
+
+def build_cat_sprite(ears, eyes):
+    """Pre-render the cat at CAT_SPRITE_SCALE, returning it with its centre anchor."""
+    s = CAT_SPRITE_SCALE
+    cat_width, cat_height = int(40 * s), int(40 * 0.7 * s)
+    left = cat_width // 2 + int(30 * s) + 4
+    right = cat_width // 3 + int(25 * s) + 2
+    top = cat_height // 3 + int(25 * s) + 2
+    bottom = cat_height // 2 + int(15 * s) + 4
+    sprite = pygame.Surface((left + right, top + bottom), pygame.SRCALPHA)
+    draw_cat(sprite, left, top, s, ears, eyes)
+    return sprite.convert_alpha(), (left, top)
+
+
+def build_ufo_sprite():
+    """Pre-render the UFO dome, base and window, returning it with its centre anchor."""
+    # The base disc is the widest part and reaches lowest; the dome sits on top
+    anchor_x, anchor_y = 60, 20
+    sprite = pygame.Surface((120, 60), pygame.SRCALPHA)
+    pygame.draw.ellipse(sprite, (200, 200, 200), (anchor_x - 50, anchor_y - 20, 100, 40))
+    pygame.draw.ellipse(sprite, (150, 150, 150), (anchor_x - 50, anchor_y - 20, 100, 40), 2)
+    pygame.draw.ellipse(sprite, (180, 180, 180), (anchor_x - 60, anchor_y + 10, 120, 30))
+    pygame.draw.ellipse(sprite, (100, 100, 100), (anchor_x - 60, anchor_y + 10, 120, 30), 2)
+    pygame.draw.circle(sprite, (100, 150, 200), (anchor_x, anchor_y), 15)
+    pygame.draw.circle(sprite, (50, 100, 150), (anchor_x, anchor_y), 15, 2)
+    return sprite.convert_alpha(), (anchor_x, anchor_y)
+
+
+def build_light_sprite(color):
+    """Pre-render one 5px UFO light, centred at (5, 5)."""
+    sprite = pygame.Surface((11, 11), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (5, 5), 5)
+    return sprite.convert_alpha()
+
+
+def select_video_encoder():
+    """Return ffmpeg codec arguments for the first H.264 encoder that works here."""
+    for encoder_args in VIDEO_ENCODERS:
+        # Listing the encoder isn't enough (builds often include NVENC without a
+        # GPU), so try a tiny encode
+        probe = ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-f', 'lavfi',
+                 '-i', 'color=size=256x256:duration=0.1', *encoder_args, '-f', 'null', '-']
+        try:
+            if subprocess.run(probe, stdin=subprocess.DEVNULL, capture_output=True).returncode == 0:
+                return encoder_args
+        except FileNotFoundError:
+            break
+    return SOFTWARE_ENCODER
+
+
+def load_wav(path):
+    """Load a 16-bit WAV as float32 stereo samples at MIX_SAMPLE_RATE."""
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path} is not 16-bit PCM")
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+    samples = samples.reshape(-1, channels).astype(np.float32)
+    if channels == 1:
+        samples = np.repeat(samples, 2, axis=1)
+    if rate != MIX_SAMPLE_RATE:
+        # Linear resample each channel onto the mix rate
+        src_t = np.arange(len(samples)) / rate
+        dst_t = np.arange(int(len(samples) * MIX_SAMPLE_RATE / rate)) / MIX_SAMPLE_RATE
+        samples = np.stack([np.interp(dst_t, src_t, samples[:, c]) for c in range(2)], axis=1)
+    return samples[:, :2].astype(np.float32)
+
+
 def create_audio_track(animation_events, total_duration_s, output_file):
-    """Create complete audio track by mixing all sounds at correct timestamps using moviepy."""
-    print("🎵 Building audio track with moviepy...")
+    """Create complete audio track by mixing all sounds at correct timestamps with NumPy."""
+    print("🎵 Building audio track...")
     
-    audio_clips = []
+    mix = np.zeros((int(total_duration_s * MIX_SAMPLE_RATE), 2), dtype=np.float32)
+    clip_cache = {}
+    clips_added = 0
+
+    def load_clip(path):
+        # Decode each asset once
+        if path not in clip_cache:
+            clip_cache[path] = load_wav(path)
+        return clip_cache[path]
+
+    def add_clip(samples, timestamp_s):
+        start = int(timestamp_s * MIX_SAMPLE_RATE)
+        samples = samples[:max(0, len(mix) - start)]
+        mix[start:start + len(samples)] += samples
     
     # Add each audio event
     for event in animation_events:
@@ -116,48 +256,39 @@ def create_audio_track(animation_events, total_duration_s, output_file):
         
         try:
             if event_type == 'meow':
-                clip = AudioFileClip("assets/00_00_meow.wav").set_start(timestamp_s)
-                audio_clips.append(clip)
+                add_clip(load_clip("assets/00_00_meow.wav"), timestamp_s)
                 print(f"  Added meow at {timestamp_s:.2f}s")
                 
             elif event_type == 'collision':
-                clip = AudioFileClip("assets/06_collide.wav").set_start(timestamp_s)
-                audio_clips.append(clip)
+                add_clip(load_clip("assets/06_collide.wav"), timestamp_s)
                 print(f"  Added collision at {timestamp_s:.2f}s")
                 
             elif event_type == 'dialogue':
                 dialogue_file = event['file']
-                clip = AudioFileClip(dialogue_file).set_start(timestamp_s)
-                audio_clips.append(clip)
+                add_clip(load_clip(dialogue_file), timestamp_s)
                 print(f"  Added dialogue at {timestamp_s:.2f}s: {dialogue_file}")
                 
             elif event_type == 'walking_start':
                 # Loop walking sound for the duration
-                walking_clip = AudioFileClip("assets/walking.wav")
+                walking_clip = load_clip("assets/walking.wav")
                 duration_s = event['duration_ms'] / 1000.0
-                # Loop the clip
-                loops_needed = int(duration_s / walking_clip.duration) + 1
-                looped = concatenate_audioclips([walking_clip] * loops_needed)
-                looped = looped.subclip(0, duration_s).set_start(timestamp_s)
-                audio_clips.append(looped)
+                looped = np.resize(walking_clip, (int(duration_s * MIX_SAMPLE_RATE), 2))
+                add_clip(looped, timestamp_s)
                 print(f"  Added walking sound at {timestamp_s:.2f}s for {duration_s:.2f}s")
+            else:
+                continue
+            clips_added += 1
                 
         except Exception as e:
             print(f"  Warning: Could not add {event_type}: {e}")
     
-    if audio_clips:
-        # Composite all audio clips
-        final_audio = CompositeAudioClip(audio_clips)
-        # Set duration to match video
-        final_audio = final_audio.set_duration(total_duration_s)
-        # Write to file
-        final_audio.write_audiofile(output_file, fps=44100, codec='pcm_s16le')
-        
-        # Close clips
-        for clip in audio_clips:
-            clip.close()
-        final_audio.close()
-        
+    if clips_added:
+        # Clip the summed samples back into 16-bit range and write the track
+        with wave.open(output_file, "wb") as out:
+            out.setnchannels(2)
+            out.setsampwidth(2)
+            out.setframerate(MIX_SAMPLE_RATE)
+            out.writeframes(np.clip(mix, -32768, 32767).astype(np.int16).tobytes())
         return True
     return False
 
@@ -168,17 +299,40 @@ def export_tiktok_video():
     print(f"📐 Output: {TIKTOK_WIDTH}x{TIKTOK_HEIGHT} (9:16 vertical)")
     print(f"🎞️  Frame rate: {FPS} FPS")
     print(f"✂️  Cropping from center of {SCREEN_WIDTH}x{SCREEN_HEIGHT}\n")
+
+    # Frames are piped straight into ffmpeg, so there is nothing to render without it
+    if shutil.which("ffmpeg") is None:
+        print("❌ Error: ffmpeg not found. Install ffmpeg to export video.")
+        return
     
     temp_dir = tempfile.mkdtemp()
-    frames_dir = os.path.join(temp_dir, "frames")
-    os.makedirs(frames_dir, exist_ok=True)
+    temp_video = os.path.join(temp_dir, "temp_video.mp4")
     
-    # Initialize Pygame
+    # Initialize Pygame. The soundtrack is mixed from the recorded audio
+    # events, so the mixer uses SDL's silent driver rather than playing every
+    # cue at the export's faster-than-real-time pace
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
     pygame.init()
     pygame.mixer.init(frequency=AUDIO_SAMPLE_RATE, size=-16, channels=2, buffer=AUDIO_BUFFER_SIZE)
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Frames only go to ffmpeg, so render into a hidden display
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.HIDDEN)
     pygame.display.set_caption("Exporting TikTok Video...")
-    clock = pygame.time.Clock()
+
+    # The park background is static, so render it once and blit it per frame
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    draw_park_background(background)
+
+    # Cat and UFO art is pre-rendered once; the cat is smoothscaled per frame
+    cat_sprites = {
+        (ears, eyes): build_cat_sprite(ears, eyes)
+        for ears, eyes in [(False, False), (True, False), (True, True)]
+    }
+    cat_frame_key = None
+    cat_frame = None
+    ufo_sprite, (ufo_anchor_x, ufo_anchor_y) = build_ufo_sprite()
+    ufo_lights = [build_light_sprite(color)
+                  for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (255, 0, 255)]]
+    ufo_light_off = build_light_sprite((100, 100, 100))
 
     # Initialize audio manager
     audio_manager = AudioManager()
@@ -196,13 +350,20 @@ def export_tiktok_video():
     except:
         meow_sound = None
 
+    try:
+        spaceship_sound = pygame.mixer.Sound("assets/000_spaceship.wav")
+        print("✓ Loaded spaceship sound")
+    except (FileNotFoundError, pygame.error):
+        spaceship_sound = None
+
     # Create characters
     char1 = Character(x=-50, y=SCREEN_HEIGHT - 200, color=BLUE, name="Character 1", voice="alloy")
     char2 = Character(x=SCREEN_WIDTH + 10, y=SCREEN_HEIGHT - 200, color=RED, name="Character 2", voice="echo")
     char2.direction = -1
 
     # Initialize animation
-    animation = AnimationController(char1, char2, audio_manager, walking_sound, collision_sound, meow_sound)
+    animation = AnimationController(char1, char2, audio_manager, walking_sound, collision_sound, meow_sound,
+                                    spaceship_sound)
 
     # Track audio events with timestamps
     audio_events = []
@@ -210,7 +371,49 @@ def export_tiktok_video():
     running = True
     last_phase = None
     walking_start_time = None
+    was_colliding = False
+    # Bounding boxes for the per-frame contact check, updated in place
+    char1_rect, char2_rect = char1.get_rect(), char2.get_rect()
     
+    # Stream raw frames into ffmpeg as they are rendered; audio is muxed in
+    # afterwards once all events are known
+    encoder_args = select_video_encoder()
+    print(f"✓ Video encoder: {encoder_args[1]}")
+    video_cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+                 '-s', f'{TIKTOK_WIDTH}x{TIKTOK_HEIGHT}', '-r', str(FPS), '-i', '-',
+                 *encoder_args, '-pix_fmt', 'yuv420p', temp_video]
+    encoder = subprocess.Popen(video_cmd, stdin=subprocess.PIPE)
+
+    # Upscale and pipe frames on a background thread (cv2 and pipe writes
+    # release the GIL) so rendering the next frame overlaps encoding this one.
+    # Cropped buffers cycle between the free and pending queues.
+    free_buffers = queue.Queue()
+    for _ in range(FRAME_BUFFER_COUNT):
+        free_buffers.put(np.empty((SCREEN_HEIGHT, CROP_WIDTH, 3), dtype=np.uint8))
+    pending_frames = queue.Queue(maxsize=FRAME_BUFFER_COUNT)
+    # Set if ffmpeg stops accepting frames; the thread keeps recycling buffers
+    # so the render loop never blocks, and the loop stops recording
+    encoder_failed = threading.Event()
+
+    def encode_frames():
+        resized_frame = np.empty((TIKTOK_HEIGHT, TIKTOK_WIDTH, 3), dtype=np.uint8)
+        while True:
+            cropped_frame = pending_frames.get()
+            if cropped_frame is None:
+                break
+            if encoder_failed.is_set():
+                free_buffers.put(cropped_frame)
+                continue
+            cv2.resize(cropped_frame, (TIKTOK_WIDTH, TIKTOK_HEIGHT), dst=resized_frame, interpolation=cv2.INTER_CUBIC)
+            free_buffers.put(cropped_frame)
+            try:
+                encoder.stdin.write(memoryview(resized_frame))
+            except OSError:
+                encoder_failed.set()  # ffmpeg exited early; its exit code is reported after the loop
+
+    encode_thread = threading.Thread(target=encode_frames, daemon=True)
+    encode_thread.start()
+
     print("🎥 Recording frames and tracking audio events...\n")
     
     while running:
@@ -218,7 +421,9 @@ def export_tiktok_video():
             if event.type == pygame.QUIT:
                 running = False
 
-        current_time = pygame.time.get_ticks()
+        # Virtual clock driven by the frame index: the export runs as fast as it
+        # can render, and audio event timestamps line up exactly with frames
+        current_time = frame_count * 1000 // FPS
         current_phase = animation.phase
         
         # Track phase changes for audio events
@@ -272,13 +477,17 @@ def export_tiktok_video():
                 
             last_phase = current_phase
 
-        # Track collision sounds during bump sequence and collision loop
-        if current_phase == animation.AnimationPhase.BUMP_SEQUENCE:
-            if char1.get_rect().colliderect(char2.get_rect()):
-                audio_events.append({'type': 'collision', 'timestamp_ms': current_time})
-        elif current_phase == animation.AnimationPhase.COLLISION_LOOP:
-            if char1.get_rect().colliderect(char2.get_rect()):
+        # Track collision sounds during bump sequence and collision loop, once
+        # per contact rather than on every overlapping frame
+        if current_phase in (animation.AnimationPhase.BUMP_SEQUENCE, animation.AnimationPhase.COLLISION_LOOP):
+            char1_rect.update(char1.x, char1.y, char1.width, char1.height)
+            char2_rect.update(char2.x, char2.y, char2.width, char2.height)
+            colliding = char1_rect.colliderect(char2_rect)
+            if colliding and not was_colliding:
                 audio_events.append({'type': 'collision', 'timestamp_ms': current_time})
+        else:
+            colliding = False
+        was_colliding = colliding
 
         animation.update(current_time)
 
@@ -291,56 +500,23 @@ def export_tiktok_video():
                 running = False
 
         # Draw everything
-        draw_park_background(screen)
+        screen.blit(background, (0, 0))
 
         # Draw cat
         if animation.phase == animation.AnimationPhase.CAT_RUN:
             cat_x, cat_y = int(animation.cat_x), SCREEN_HEIGHT - 150
             cat_scale = animation.cat_scale
-            base_size = 40
-            cat_width = int(base_size * cat_scale)
-            cat_height = int(base_size * 0.7 * cat_scale)
-            
-            body_rect = pygame.Rect(cat_x - cat_width // 2, cat_y - cat_height // 2, cat_width, cat_height)
-            pygame.draw.ellipse(screen, (255, 140, 0), body_rect)
-            pygame.draw.ellipse(screen, (200, 100, 0), body_rect, max(1, int(2 * cat_scale)))
-            
-            head_size = int(25 * cat_scale)
-            head_x = cat_x + int(cat_width // 3)
-            head_y = cat_y - int(cat_height // 3)
-            pygame.draw.circle(screen, (255, 140, 0), (head_x, head_y), head_size)
-            pygame.draw.circle(screen, (200, 100, 0), (head_x, head_y), head_size, max(1, int(2 * cat_scale)))
-            
-            if cat_scale > 0.3:
-                left_ear = [(head_x - int(12 * cat_scale), head_y - int(15 * cat_scale)),
-                           (head_x - int(5 * cat_scale), head_y - int(5 * cat_scale)),
-                           (head_x - int(15 * cat_scale), head_y - int(5 * cat_scale))]
-                pygame.draw.polygon(screen, (255, 140, 0), left_ear)
-                pygame.draw.polygon(screen, (200, 100, 0), left_ear, max(1, int(2 * cat_scale)))
-                
-                right_ear = [(head_x + int(12 * cat_scale), head_y - int(15 * cat_scale)),
-                            (head_x + int(5 * cat_scale), head_y - int(5 * cat_scale)),
-                            (head_x + int(15 * cat_scale), head_y - int(5 * cat_scale))]
-                pygame.draw.polygon(screen, (255, 140, 0), right_ear)
-                pygame.draw.polygon(screen, (200, 100, 0), right_ear, max(1, int(2 * cat_scale)))
-                
-                if cat_scale > 0.6:
-                    eye_size = max(2, int(3 * cat_scale))
-                    pygame.draw.circle(screen, (0, 0, 0), (head_x - int(6 * cat_scale), head_y), eye_size)
-                    pygame.draw.circle(screen, (0, 0, 0), (head_x + int(6 * cat_scale), head_y), eye_size)
-            
-            tail_length = int(30 * cat_scale)
-            tail_x = cat_x - int(cat_width // 2)
-            tail_y = cat_y
-            pygame.draw.line(screen, (255, 140, 0), (tail_x, tail_y),
-                           (tail_x - tail_length, tail_y - int(tail_length * 0.7)), max(2, int(4 * cat_scale)))
-            
-            leg_length = int(15 * cat_scale)
-            leg_spacing = int(10 * cat_scale)
-            for i in range(2):
-                leg_x = cat_x - int(cat_width // 4) + i * leg_spacing
-                pygame.draw.line(screen, (255, 140, 0), (leg_x, cat_y + cat_height // 2),
-                               (leg_x, cat_y + cat_height // 2 + leg_length), max(2, int(3 * cat_scale)))
+
+            # Scale the pre-rendered cat sprite instead of redrawing it
+            ears, eyes = cat_scale > 0.3, cat_scale > 0.6
+            sprite, (anchor_x, anchor_y) = cat_sprites[ears, eyes]
+            ratio = cat_scale / CAT_SPRITE_SCALE
+            size = (max(1, int(sprite.get_width() * ratio)),
+                    max(1, int(sprite.get_height() * ratio)))
+            if cat_frame_key != (size, ears, eyes):
+                cat_frame_key = (size, ears, eyes)
+                cat_frame = pygame.transform.smoothscale(sprite, size)
+            screen.blit(cat_frame, (cat_x - int(anchor_x * ratio), cat_y - int(anchor_y * ratio)))
 
         # Draw UFO
         if animation.phase == animation.AnimationPhase.ALIEN_ABDUCTION:
@@ -355,64 +531,66 @@ def export_tiktok_video():
                                    (ufo_center_x - width // 2, y), (ufo_center_x + width // 2, y), 2)
             
             ufo_x, ufo_y = int(char2.get_center_x()), int(animation.ufo_y)
-            pygame.draw.ellipse(screen, (200, 200, 200), (ufo_x - 50, ufo_y - 20, 100, 40))
-            pygame.draw.ellipse(screen, (150, 150, 150), (ufo_x - 50, ufo_y - 20, 100, 40), 2)
-            pygame.draw.ellipse(screen, (180, 180, 180), (ufo_x - 60, ufo_y + 10, 120, 30))
-            pygame.draw.ellipse(screen, (100, 100, 100), (ufo_x - 60, ufo_y + 10, 120, 30), 2)
+            screen.blit(ufo_sprite, (ufo_x - ufo_anchor_x, ufo_y - ufo_anchor_y))
             
             light_positions = [-40, -20, 0, 20, 40]
             for i, lx in enumerate(light_positions):
-                light_color = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (255, 0, 255)][i]
-                if (current_time // 200 + i) % 2 == 0:
-                    pygame.draw.circle(screen, light_color, (ufo_x + lx, ufo_y + 20), 5)
-                else:
-                    pygame.draw.circle(screen, (100, 100, 100), (ufo_x + lx, ufo_y + 20), 5)
-            
-            pygame.draw.circle(screen, (100, 150, 200), (ufo_x, ufo_y), 15)
-            pygame.draw.circle(screen, (50, 100, 150), (ufo_x, ufo_y), 15, 2)
+                light = ufo_lights[i] if (current_time // 200 + i) % 2 == 0 else ufo_light_off
+                screen.blit(light, (ufo_x + lx - 5, ufo_y + 15))
 
         char1.draw(screen)
         char2.draw(screen)
-        animation.draw_dialogue(screen)
-
-        # Capture and crop frame
-        frame = pygame.surfarray.array3d(screen)
-        frame = np.transpose(frame, (1, 0, 2))
-        cropped_frame = frame[:, CROP_X:CROP_X + CROP_WIDTH, :]
-        resized_frame = cv2.resize(cropped_frame, (TIKTOK_WIDTH, TIKTOK_HEIGHT), interpolation=cv2.INTER_LANCZOS4)
-        resized_frame = cv2.cvtColor(resized_frame, cv2.COLOR_RGB2BGR)
-        
-        frame_path = os.path.join(frames_dir, f"frame_{frame_count:05d}.png")
-        cv2.imwrite(frame_path, resized_frame)
+        animation.draw_dialogue(screen, current_time)
+
+        # Capture and crop frame straight from the screen pixels, converting to
+        # BGR at source size; the encode thread upscales and pipes it
+        cropped_frame = free_buffers.get()
+        pixels = pygame.surfarray.pixels3d(screen)
+        cv2.cvtColor(pixels.swapaxes(0, 1)[:, CROP_X:CROP_X + CROP_WIDTH], cv2.COLOR_RGB2BGR, dst=cropped_frame)
+        del pixels  # Release the surface lock before drawing again
+        pending_frames.put(cropped_frame)
+
+        if encoder_failed.is_set():
+            print("❌ ffmpeg stopped accepting frames; stopping the recording")
+            running = False
         
         frame_count += 1
         if frame_count % 60 == 0:
             print(f"  Recorded {frame_count} frames ({frame_count // FPS}s)")
 
-        pygame.display.flip()
-        clock.tick(FPS)
-
     pygame.quit()
     
     total_duration_s = frame_count / FPS
     print(f"\n✓ Recorded {frame_count} frames ({total_duration_s:.2f}s)")
     
-    # Create audio track
+    # Create audio track while ffmpeg finishes encoding the queued frames
     audio_file = os.path.join(temp_dir, "audio.wav")
-    audio_created = create_audio_track(audio_events, total_duration_s, audio_file)
+    with ThreadPoolExecutor(max_workers=1) as audio_pool:
+        audio_future = audio_pool.submit(create_audio_track, audio_events, total_duration_s, audio_file)
+        pending_frames.put(None)
+        encode_thread.join()
+        try:
+            encoder.stdin.close()
+        except OSError:
+            pass
+        encoder_returncode = encoder.wait()
+        audio_created = audio_future.result()
+
+    if encoder_returncode != 0:
+        print(f"❌ Error: ffmpeg video encode failed (exit code {encoder_returncode})")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return
     
     if audio_created:
         print("✓ Audio track created")
     else:
         print("⚠️  No audio events found")
     
-    # Create video from frames
+    # Mux the encoded video with the audio track
     print("🎬 Creating video...")
-    temp_video = os.path.join(temp_dir, "temp_video.mp4")
     
-    cmd = ['ffmpeg', '-y', '-framerate', str(FPS), '-i', os.path.join(frames_dir, 'frame_%05d.png'),
-           '-i', audio_file, '-c:v', 'libx264', '-preset', 'medium', '-crf', '18',
-           '-pix_fmt', 'yuv420p', '-c:a', 'aac', '-b:a', '192k', '-shortest', OUTPUT_FILENAME]
+    cmd = ['ffmpeg', '-y', '-i', temp_video, '-i', audio_file, '-c:v', 'copy',
+           '-c:a', 'aac', '-b:a', '192k', '-shortest', OUTPUT_FILENAME]
     
     result = subprocess.run(cmd, capture_output=True, text=True)
     
@@ -428,7 +606,6 @@ def export_tiktok_video():
         print(f"❌ Error: {result.stderr}")
     
     # Cleanup
-    import shutil
     try:
         shutil.rmtree(temp_dir)
     except:
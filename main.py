@@ -2,7 +2,10 @@
 
 import sys
 import math
+import functools
+from typing import Optional
 
+import numpy as np
 import pygame
 
 from src.animation import AnimationController
@@ -19,25 +22,90 @@ from src.config import (
     AUDIO_BUFFER_SIZE,
 )
 
+# Tractor beam cone
+BEAM_COLOR = (150, 255, 150)
+BEAM_TOP_WIDTH = 60
+BEAM_BOTTOM_WIDTH = 120
+
+CAT_SPRITE_SCALE = 1.5  # Largest scale the cat reaches; sprites only shrink
+
+# Sound effects passed to the animation controller, in its argument order
+SOUND_EFFECTS = [
+    ("collision", "assets/06_collide.wav"),
+    ("meow", "assets/00_00_meow.wav"),
+    ("spaceship", "assets/000_spaceship.wav"),
+]
+
+
+@functools.cache
+def build_tree_stamp() -> pygame.Surface:
+    """Pre-render one tree, with the top of its trunk at (50, 60)."""
+    stamp = pygame.Surface((101, 121), pygame.SRCALPHA)
+    # Tree trunk
+    trunk_width = 20
+    trunk_height = 60
+    tree_x, trunk_y = 50, 60
+    pygame.draw.rect(stamp, (101, 67, 33),
+                    (tree_x - trunk_width // 2, trunk_y, trunk_width, trunk_height))
+    
+    # Tree foliage (circles)
+    foliage_y = trunk_y - 20
+    pygame.draw.circle(stamp, (34, 139, 34), (tree_x, foliage_y), 40)
+    pygame.draw.circle(stamp, (50, 150, 50), (tree_x - 20, foliage_y + 10), 30)
+    pygame.draw.circle(stamp, (50, 150, 50), (tree_x + 20, foliage_y + 10), 30)
+    return stamp.convert_alpha()
+
+
+@functools.cache
+def build_cloud_stamp() -> pygame.Surface:
+    """Pre-render one cloud, centred at (50, 35)."""
+    stamp = pygame.Surface((101, 66), pygame.SRCALPHA)
+    cloud_x, cloud_y = 50, 35
+    pygame.draw.circle(stamp, (255, 255, 255), (cloud_x, cloud_y), 30)
+    pygame.draw.circle(stamp, (255, 255, 255), (cloud_x + 25, cloud_y), 25)
+    pygame.draw.circle(stamp, (255, 255, 255), (cloud_x - 25, cloud_y), 25)
+    pygame.draw.circle(stamp, (255, 255, 255), (cloud_x + 10, cloud_y - 15), 20)
+    return stamp.convert_alpha()
+
+
+@functools.cache
+def build_flower_stamp() -> pygame.Surface:
+    """Pre-render one flowering bush, centred at (15, 15)."""
+    stamp = pygame.Surface((31, 31), pygame.SRCALPHA)
+    fx = fy = 15
+    # Bush
+    pygame.draw.circle(stamp, (60, 120, 60), (fx, fy), 15)
+    # Flowers
+    for i in range(3):
+        flower_x = fx + (i - 1) * 10
+        flower_y = fy - 10
+        pygame.draw.circle(stamp, (255, 100, 150), (flower_x, flower_y), 4)
+        pygame.draw.circle(stamp, (255, 200, 0), (flower_x, flower_y), 2)
+    return stamp.convert_alpha()
+
+
+@functools.cache
+def build_sun_glow() -> pygame.Surface:
+    """Pre-render the five stacked translucent sun-glow rings into one surface."""
+    glow = pygame.Surface((100, 100), pygame.SRCALPHA)
+    for i in range(5, 0, -1):
+        # Inner rings sit under every larger ring, so their alpha accumulates
+        alpha = round(255 * (1 - (1 - 30 / 255) ** (6 - i)))
+        pygame.draw.circle(glow, (255, 255, 0, alpha), (50, 50), 30 + i * 5)
+    return glow.convert_alpha()
+
 
 def draw_park_background(screen: pygame.Surface) -> None:
     """Draw a park setting background."""
-    # Sky gradient (light blue to lighter blue)
-    for y in range(SCREEN_HEIGHT // 2):
-        ratio = y / (SCREEN_HEIGHT // 2)
-        r = int(135 + (180 - 135) * ratio)
-        g = int(206 + (220 - 206) * ratio)
-        b = int(235 + (245 - 235) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-    
-    # Grass (green gradient)
+    # Sky and grass gradients, built as one color column and broadcast across the width
     grass_start_y = SCREEN_HEIGHT // 2
-    for y in range(grass_start_y, SCREEN_HEIGHT):
-        ratio = (y - grass_start_y) / (SCREEN_HEIGHT - grass_start_y)
-        r = int(100 + (80 - 100) * ratio)
-        g = int(180 + (150 - 180) * ratio)
-        b = int(100 + (80 - 100) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+    sky_ratio = np.arange(grass_start_y)[:, None] / grass_start_y
+    grass_ratio = (np.arange(grass_start_y, SCREEN_HEIGHT)[:, None] - grass_start_y) / (SCREEN_HEIGHT - grass_start_y)
+    column = np.concatenate((
+        np.array([135, 206, 235]) + np.array([180 - 135, 220 - 206, 245 - 235]) * sky_ratio,
+        np.array([100, 180, 100]) + np.array([80 - 100, 150 - 180, 80 - 100]) * grass_ratio,
+    )).astype(np.uint8)
+    pygame.surfarray.blit_array(screen, np.broadcast_to(column, (SCREEN_WIDTH, SCREEN_HEIGHT, 3)))
     
     # Path/walkway (light gray)
     path_y = SCREEN_HEIGHT - 200
@@ -53,35 +121,19 @@ def draw_park_background(screen: pygame.Surface) -> None:
     
     # Trees in background (simple)
     tree_positions = [100, 300, 500, 700]
-    for tree_x in tree_positions:
-        # Tree trunk
-        trunk_width = 20
-        trunk_height = 60
-        trunk_y = grass_start_y + 40
-        pygame.draw.rect(screen, (101, 67, 33),
-                        (tree_x - trunk_width // 2, trunk_y, trunk_width, trunk_height))
-        
-        # Tree foliage (circles)
-        foliage_y = trunk_y - 20
-        pygame.draw.circle(screen, (34, 139, 34), (tree_x, foliage_y), 40)
-        pygame.draw.circle(screen, (50, 150, 50), (tree_x - 20, foliage_y + 10), 30)
-        pygame.draw.circle(screen, (50, 150, 50), (tree_x + 20, foliage_y + 10), 30)
+    trunk_y = grass_start_y + 40
+    screen.blits([(build_tree_stamp(), (tree_x - 50, trunk_y - 60))
+                  for tree_x in tree_positions], doreturn=False)
     
     # Clouds (simple white circles)
     cloud_positions = [(150, 80), (400, 60), (650, 90)]
-    for cloud_x, cloud_y in cloud_positions:
-        pygame.draw.circle(screen, (255, 255, 255), (cloud_x, cloud_y), 30)
-        pygame.draw.circle(screen, (255, 255, 255), (cloud_x + 25, cloud_y), 25)
-        pygame.draw.circle(screen, (255, 255, 255), (cloud_x - 25, cloud_y), 25)
-        pygame.draw.circle(screen, (255, 255, 255), (cloud_x + 10, cloud_y - 15), 20)
+    screen.blits([(build_cloud_stamp(), (cloud_x - 50, cloud_y - 35))
+                  for cloud_x, cloud_y in cloud_positions], doreturn=False)
     
     # Sun
     sun_x, sun_y = 700, 100
     # Sun glow
-    for i in range(5, 0, -1):
-        alpha_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
-        pygame.draw.circle(alpha_surf, (255, 255, 0, 30), (50, 50), 30 + i * 5)
-        screen.blit(alpha_surf, (sun_x - 50, sun_y - 50))
+    screen.blit(build_sun_glow(), (sun_x - 50, sun_y - 50))
     # Sun core
     pygame.draw.circle(screen, (255, 255, 0), (sun_x, sun_y), 30)
     pygame.draw.circle(screen, (255, 255, 150), (sun_x, sun_y), 25)
@@ -89,15 +141,110 @@ def draw_park_background(screen: pygame.Surface) -> None:
     # Flowers/bushes on grass
     flower_positions = [(80, grass_start_y + 20), (250, grass_start_y + 30),
                        (450, grass_start_y + 25), (620, grass_start_y + 35)]
-    for fx, fy in flower_positions:
-        # Bush
-        pygame.draw.circle(screen, (60, 120, 60), (fx, fy), 15)
-        # Flowers
-        for i in range(3):
-            flower_x = fx + (i - 1) * 10
-            flower_y = fy - 10
-            pygame.draw.circle(screen, (255, 100, 150), (flower_x, flower_y), 4)
-            pygame.draw.circle(screen, (255, 200, 0), (flower_x, flower_y), 2)
+    screen.blits([(build_flower_stamp(), (fx - 15, fy - 15))
+                  for fx, fy in flower_positions], doreturn=False)
+
+@functools.lru_cache(maxsize=1)
+def build_tractor_beam(top_y: float, beam_alpha: float) -> pygame.Surface:
+    """Build the tractor beam cone; reused while the UFO and beam hold steady."""
+    start_y = int(top_y)
+    rows = SCREEN_HEIGHT - start_y
+
+    # Per-row width and alpha, widening and fading towards the ground
+    progress = (np.arange(start_y, SCREEN_HEIGHT) - top_y) / (SCREEN_HEIGHT - top_y)
+    half_widths = (BEAM_TOP_WIDTH + (BEAM_BOTTOM_WIDTH - BEAM_TOP_WIDTH) * progress).astype(np.int32) // 2
+    alphas = (beam_alpha * (1 - progress * 0.5)).astype(np.uint8)
+
+    # Each pixel is one little-endian RGBA word, so the whole cone is a single np.where
+    half_span = BEAM_BOTTOM_WIDTH // 2
+    offsets = np.abs(np.arange(-half_span, half_span + 1))
+    color = np.uint32(BEAM_COLOR[0] | BEAM_COLOR[1] << 8 | BEAM_COLOR[2] << 16)
+    row_pixels = color | alphas.astype(np.uint32) << 24
+    beam = np.where(offsets[None, :] <= half_widths[:, None], row_pixels[:, None], color).astype("<u4", copy=False)
+
+    return pygame.image.frombuffer(beam, (offsets.size, rows), "RGBA").convert_alpha()
+
+
+@functools.cache
+def build_ufo_lights(phase: int) -> pygame.Surface:
+    """Pre-render the row of five UFO lights for one blink phase, centred at (45, 5)."""
+    lights = pygame.Surface((91, 11), pygame.SRCALPHA)
+    light_colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (255, 0, 255)]
+    for i, lx in enumerate([-40, -20, 0, 20, 40]):
+        # Neighbouring lights blink out of step with each other
+        color = light_colors[i] if (phase + i) % 2 == 0 else (100, 100, 100)
+        pygame.draw.circle(lights, color, (45 + lx, 5), 5)
+    return lights.convert_alpha()
+
+
+def draw_cat(surface, cat_x, cat_y, cat_scale, ears=True, eyes=True):
+    """Draw the running cat centred on (cat_x, cat_y) at the given scale."""
+    # Scale-dependent sizes, computed once per call
+    s = cat_scale
+    cat_width, cat_height = int(40 * s), int(40 * 0.7 * s)
+    outline = max(1, int(2 * s))
+    head_size = int(25 * s)
+    e5, e12, e15 = int(5 * s), int(12 * s), int(15 * s)
+    tail_length = int(30 * s)
+    leg_length, leg_spacing = int(15 * s), int(10 * s)
+
+    body_rect = pygame.Rect(cat_x - cat_width // 2, cat_y - cat_height // 2, cat_width, cat_height)
+    pygame.draw.ellipse(surface, (255, 140, 0), body_rect)
+    pygame.draw.ellipse(surface, (200, 100, 0), body_rect, outline)
+
+    head_x = cat_x + cat_width // 3
+    head_y = cat_y - cat_height // 3
+    pygame.draw.circle(surface, (255, 140, 0), (head_x, head_y), head_size)
+    pygame.draw.circle(surface, (200, 100, 0), (head_x, head_y), head_size, outline)
+
+    if ears:
+        left_ear = [(head_x - e12, head_y - e15), (head_x - e5, head_y - e5), (head_x - e15, head_y - e5)]
+        pygame.draw.polygon(surface, (255, 140, 0), left_ear)
+        pygame.draw.polygon(surface, (200, 100, 0), left_ear, outline)
+
+        right_ear = [(head_x + e12, head_y - e15), (head_x + e5, head_y - e5), (head_x + e15, head_y - e5)]
+        pygame.draw.polygon(surface, (255, 140, 0), right_ear)
+        pygame.draw.polygon(surface, (200, 100, 0), right_ear, outline)
+
+        if eyes:
+            eye_size, e6 = max(2, int(3 * s)), int(6 * s)
+            pygame.draw.circle(surface, (0, 0, 0), (head_x - e6, head_y), eye_size)
+            pygame.draw.circle(surface, (0, 0, 0), (head_x + e6, head_y), eye_size)
+
+    tail_x = cat_x - cat_width // 2
+    tail_y = cat_y
+    pygame.draw.line(surface, (255, 140, 0), (tail_x, tail_y),
+                     (tail_x - tail_length, tail_y - int(tail_length * 0.7)), max(2, int(4 * s)))
+
+    leg_top = cat_y + cat_height // 2
+    leg_width = max(2, int(3 * s))
+    for i in range(2):
+        leg_x = cat_x - cat_width // 4 + i * leg_spacing
+        pygame.draw.line(surface, (255, 140, 0), (leg_x, leg_top), (leg_x, leg_top + leg_length), leg_width)
+
+
+def build_cat_sprite(ears, eyes):
+    """Pre-render the cat at CAT_SPRITE_SCALE, returning it with its centre anchor."""
+    s = CAT_SPRITE_SCALE
+    cat_width, cat_height = int(40 * s), int(40 * 0.7 * s)
+    left = cat_width // 2 + int(30 * s) + 4
+    right = cat_width // 3 + int(25 * s) + 2
+    top = cat_height // 3 + int(25 * s) + 2
+    bottom = cat_height // 2 + int(15 * s) + 4
+    sprite = pygame.Surface((left + right, top + bottom), pygame.SRCALPHA)
+    draw_cat(sprite, left, top, s, ears, eyes)
+    return sprite.convert_alpha(), (left, top)
+
+
+def load_sound_effect(filepath: str, label: str) -> Optional[pygame.mixer.Sound]:
+    """Load a sound effect, or return None if it is missing or unreadable."""
+    try:
+        sound = pygame.mixer.Sound(filepath)
+        print(f"✓ Loaded {label} sound effect")
+        return sound
+    except (FileNotFoundError, pygame.error) as e:
+        print(f"Warning: Could not load {label} sound: {e}")
+        return None
 
 
 def main() -> None:
@@ -113,33 +260,26 @@ def main() -> None:
     pygame.display.set_caption("Character Animation with Audio")
     clock = pygame.time.Clock()
 
+    # The park never changes, so render it once and blit it each frame
+    background = pygame.Surface(screen.get_size()).convert()
+    draw_park_background(background)
+
+    # The cat is pre-rendered once per level of detail and smoothscaled per frame
+    cat_sprites = {
+        (ears, eyes): build_cat_sprite(ears, eyes)
+        for ears, eyes in [(False, False), (True, False), (True, True)]
+    }
+    cat_frame_key = None
+    cat_frame = None
+
     # Initialize audio manager
     audio_manager = AudioManager()
     walking_sound = audio_manager.load_walking_sound()
     
-    # Load collision sound effect
-    try:
-        collision_sound = pygame.mixer.Sound("assets/06_collide.wav")
-        print("✓ Loaded collision sound effect")
-    except (FileNotFoundError, pygame.error) as e:
-        print(f"Warning: Could not load collision sound: {e}")
-        collision_sound = None
-    
-    # Load meow sound effect
-    try:
-        meow_sound = pygame.mixer.Sound("assets/00_00_meow.wav")
-        print("✓ Loaded meow sound effect")
-    except (FileNotFoundError, pygame.error) as e:
-        print(f"Warning: Could not load meow sound: {e}")
-        meow_sound = None
-    
-    # Load spaceship sound effect
-    try:
-        spaceship_sound = pygame.mixer.Sound("assets/000_spaceship.wav")
-        print("✓ Loaded spaceship sound effect")
-    except (FileNotFoundError, pygame.error) as e:
-        print(f"Warning: Could not load spaceship sound: {e}")
-        spaceship_sound = None
+    # Load sound effects
+    collision_sound, meow_sound, spaceship_sound = (
+        load_sound_effect(filepath, label) for label, filepath in SOUND_EFFECTS
+    )
 
     # Create characters with different voices
     char1 = Character(
@@ -161,6 +301,15 @@ def main() -> None:
     # Initialize animation controller
     animation = AnimationController(char1, char2, audio_manager, walking_sound, collision_sound, meow_sound, spaceship_sound)
 
+    # Bind the lookups made every frame to locals once
+    get_ticks = pygame.time.get_ticks
+    flip = pygame.display.flip
+    draw_circle = pygame.draw.circle
+    draw_ellipse = pygame.draw.ellipse
+    CAT_RUN = animation.AnimationPhase.CAT_RUN
+    ALIEN_ABDUCTION = animation.AnimationPhase.ALIEN_ABDUCTION
+    FINISHED = animation.AnimationPhase.FINISHED
+
     # Main game loop
     running = True
     while running:
@@ -170,138 +319,67 @@ def main() -> None:
                 running = False
 
         # Update animation
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         animation.update(current_time)
+        phase = animation.phase
 
         # Auto-close when animation is finished
-        if animation.phase == animation.AnimationPhase.FINISHED:
+        if phase is FINISHED:
             # Wait 1 second after finishing, then close
             if animation.finished_time and current_time - animation.finished_time > 1000:
                 running = False
 
         # Draw park background
-        draw_park_background(screen)
+        screen.blit(background, (0, 0))
 
         # Draw cat if in cat run phase
-        if animation.phase == animation.AnimationPhase.CAT_RUN:
+        if phase is CAT_RUN:
             cat_x = int(animation.cat_x)
             cat_y = SCREEN_HEIGHT - 150
             cat_scale = animation.cat_scale
             
-            # Calculate scaled dimensions
-            base_size = 40
-            cat_width = int(base_size * cat_scale)
-            cat_height = int(base_size * 0.7 * cat_scale)
-            
-            # Cat body (oval)
-            body_rect = pygame.Rect(cat_x - cat_width // 2, cat_y - cat_height // 2,
-                                   cat_width, cat_height)
-            pygame.draw.ellipse(screen, (255, 140, 0), body_rect)  # Orange cat
-            pygame.draw.ellipse(screen, (200, 100, 0), body_rect, max(1, int(2 * cat_scale)))
-            
-            # Cat head (circle)
-            head_size = int(25 * cat_scale)
-            head_x = cat_x + int(cat_width // 3)
-            head_y = cat_y - int(cat_height // 3)
-            pygame.draw.circle(screen, (255, 140, 0), (head_x, head_y), head_size)
-            pygame.draw.circle(screen, (200, 100, 0), (head_x, head_y), head_size, max(1, int(2 * cat_scale)))
-            
-            # Cat ears (triangles)
-            if cat_scale > 0.3:  # Only draw details when cat is close enough
-                ear_size = int(10 * cat_scale)
-                # Left ear
-                left_ear = [
-                    (head_x - int(12 * cat_scale), head_y - int(15 * cat_scale)),
-                    (head_x - int(5 * cat_scale), head_y - int(5 * cat_scale)),
-                    (head_x - int(15 * cat_scale), head_y - int(5 * cat_scale))
-                ]
-                pygame.draw.polygon(screen, (255, 140, 0), left_ear)
-                pygame.draw.polygon(screen, (200, 100, 0), left_ear, max(1, int(2 * cat_scale)))
-                
-                # Right ear
-                right_ear = [
-                    (head_x + int(12 * cat_scale), head_y - int(15 * cat_scale)),
-                    (head_x + int(5 * cat_scale), head_y - int(5 * cat_scale)),
-                    (head_x + int(15 * cat_scale), head_y - int(5 * cat_scale))
-                ]
-                pygame.draw.polygon(screen, (255, 140, 0), right_ear)
-                pygame.draw.polygon(screen, (200, 100, 0), right_ear, max(1, int(2 * cat_scale)))
-                
-                # Eyes (when close)
-                if cat_scale > 0.6:
-                    eye_size = max(2, int(3 * cat_scale))
-                    pygame.draw.circle(screen, (0, 0, 0),
-                                     (head_x - int(6 * cat_scale), head_y), eye_size)
-                    pygame.draw.circle(screen, (0, 0, 0),
-                                     (head_x + int(6 * cat_scale), head_y), eye_size)
-            
-            # Cat tail (curved line)
-            tail_length = int(30 * cat_scale)
-            tail_x = cat_x - int(cat_width // 2)
-            tail_y = cat_y
-            pygame.draw.line(screen, (255, 140, 0),
-                           (tail_x, tail_y),
-                           (tail_x - tail_length, tail_y - int(tail_length * 0.7)),
-                           max(2, int(4 * cat_scale)))
-            
-            # Legs (simple lines)
-            leg_length = int(15 * cat_scale)
-            leg_spacing = int(10 * cat_scale)
-            for i in range(2):
-                leg_x = cat_x - int(cat_width // 4) + i * leg_spacing
-                pygame.draw.line(screen, (255, 140, 0),
-                               (leg_x, cat_y + cat_height // 2),
-                               (leg_x, cat_y + cat_height // 2 + leg_length),
-                               max(2, int(3 * cat_scale)))
+            # Scale the pre-rendered cat sprite instead of redrawing it;
+            # ears and eyes only show once the cat is close enough
+            ears, eyes = cat_scale > 0.3, cat_scale > 0.6
+            sprite, (anchor_x, anchor_y) = cat_sprites[ears, eyes]
+            ratio = cat_scale / CAT_SPRITE_SCALE
+            size = (max(1, int(sprite.get_width() * ratio)),
+                    max(1, int(sprite.get_height() * ratio)))
+            if cat_frame_key != (size, ears, eyes):
+                cat_frame_key = (size, ears, eyes)
+                cat_frame = pygame.transform.smoothscale(sprite, size)
+            screen.blit(cat_frame, (cat_x - int(anchor_x * ratio), cat_y - int(anchor_y * ratio)))
 
         # Draw UFO and abduction beam if in abduction phase
-        if animation.phase == animation.AnimationPhase.ALIEN_ABDUCTION:
-            # Draw tractor beam
-            if animation.beam_alpha > 0:
-                beam_surface = pygame.Surface((100, SCREEN_HEIGHT), pygame.SRCALPHA)
-                beam_color = (150, 255, 150, int(animation.beam_alpha))
-                # Draw beam as a cone shape
-                ufo_center_x = int(char2.get_center_x())
-                beam_top_width = 60
-                beam_bottom_width = 120
-                
-                for y in range(int(animation.ufo_y + 40), SCREEN_HEIGHT):
-                    progress = (y - (animation.ufo_y + 40)) / (SCREEN_HEIGHT - (animation.ufo_y + 40))
-                    width = int(beam_top_width + (beam_bottom_width - beam_top_width) * progress)
-                    alpha = int(animation.beam_alpha * (1 - progress * 0.5))
-                    pygame.draw.line(screen, (*beam_color[:3], alpha),
-                                   (ufo_center_x - width // 2, y),
-                                   (ufo_center_x + width // 2, y), 2)
+        if phase is ALIEN_ABDUCTION:
+            # Draw tractor beam, skipping it while off-screen or too faint for any row to show
+            beam_top = animation.ufo_y + 40
+            if animation.beam_alpha >= 1 and beam_top < SCREEN_HEIGHT:
+                screen.blit(build_tractor_beam(beam_top, animation.beam_alpha),
+                            (int(char2.get_center_x()) - BEAM_BOTTOM_WIDTH // 2, int(beam_top)))
             
             # Draw UFO
             ufo_x = int(char2.get_center_x())
             ufo_y = int(animation.ufo_y)
             
             # UFO dome (top)
-            pygame.draw.ellipse(screen, (200, 200, 200),
-                              (ufo_x - 50, ufo_y - 20, 100, 40))
-            pygame.draw.ellipse(screen, (150, 150, 150),
-                              (ufo_x - 50, ufo_y - 20, 100, 40), 2)
+            draw_ellipse(screen, (200, 200, 200),
+                       (ufo_x - 50, ufo_y - 20, 100, 40))
+            draw_ellipse(screen, (150, 150, 150),
+                       (ufo_x - 50, ufo_y - 20, 100, 40), 2)
             
             # UFO base (bottom disc)
-            pygame.draw.ellipse(screen, (180, 180, 180),
-                              (ufo_x - 60, ufo_y + 10, 120, 30))
-            pygame.draw.ellipse(screen, (100, 100, 100),
-                              (ufo_x - 60, ufo_y + 10, 120, 30), 2)
+            draw_ellipse(screen, (180, 180, 180),
+                       (ufo_x - 60, ufo_y + 10, 120, 30))
+            draw_ellipse(screen, (100, 100, 100),
+                       (ufo_x - 60, ufo_y + 10, 120, 30), 2)
             
-            # UFO lights
-            light_positions = [-40, -20, 0, 20, 40]
-            for i, lx in enumerate(light_positions):
-                light_color = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (255, 0, 255)][i]
-                # Blinking effect
-                if (current_time // 200 + i) % 2 == 0:
-                    pygame.draw.circle(screen, light_color, (ufo_x + lx, ufo_y + 20), 5)
-                else:
-                    pygame.draw.circle(screen, (100, 100, 100), (ufo_x + lx, ufo_y + 20), 5)
+            # UFO lights, alternating between two pre-rendered blink phases
+            screen.blit(build_ufo_lights((current_time // 200) % 2), (ufo_x - 45, ufo_y + 15))
             
             # UFO window
-            pygame.draw.circle(screen, (100, 150, 200), (ufo_x, ufo_y), 15)
-            pygame.draw.circle(screen, (50, 100, 150), (ufo_x, ufo_y), 15, 2)
+            draw_circle(screen, (100, 150, 200), (ufo_x, ufo_y), 15)
+            draw_circle(screen, (50, 100, 150), (ufo_x, ufo_y), 15, 2)
 
         # Draw characters
         char1.draw(screen)
@@ -311,7 +389,7 @@ def main() -> None:
         animation.draw_dialogue(screen)
 
         # Update display
-        pygame.display.flip()
+        flip()
         clock.tick(FPS)
 
     # Clean up
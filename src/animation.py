@@ -1,8 +1,10 @@
 """Animation state machine and logic."""
 
-from enum import Enum, auto
+import math
+from enum import IntEnum, auto
 from typing import Optional, Dict
 
+import numpy as np
 import pygame
 
 from .audio import AudioManager
@@ -24,7 +26,7 @@ from .config import (
 )
 
 
-class AnimationPhase(Enum):
+class AnimationPhase(IntEnum):
     """Enumeration of animation phases."""
 
     CAT_RUN = auto()
@@ -41,6 +43,40 @@ class AnimationPhase(Enum):
     FINISHED = auto()
 
 
+# Centre band the characters must reach for the walk-in to end in a collision
+COLLISION_ZONE_LEFT = SCREEN_WIDTH // 2 - 50
+COLLISION_ZONE_RIGHT = SCREEN_WIDTH // 2 + 50
+
+# Subtitle outline, drawn as copies of the text shifted by up to OUTLINE_THICKNESS pixels
+OUTLINE_THICKNESS = 3
+OUTLINE_OFFSETS = tuple(
+    (x, y)
+    for x in range(-OUTLINE_THICKNESS, OUTLINE_THICKNESS + 1)
+    for y in range(-OUTLINE_THICKNESS, OUTLINE_THICKNESS + 1)
+    if x != 0 or y != 0
+)
+
+# Dialogue lines, shared by preloading, the transitions and the duration lookups
+COLLISION_LINE = "WATCH IT!"
+KIDDING_LINE = "Just kidding, running into people is fun!"
+HEY_YA_LINE = "Hey ya!"
+FINAL_LINE_1 = "Okay I have to go to work"
+FINAL_LINE_2 = "I don't care"
+
+# Subtitle font size, gradient top, gradient bottom and outline color per speaker
+DIALOGUE_STYLES = {
+    "both": (64, (255, 100, 100), (200, 0, 0), (100, 0, 0)),      # Red
+    "char1": (48, (100, 150, 255), (0, 50, 200), (0, 0, 100)),    # Blue
+    "char2": (48, (255, 100, 100), (200, 0, 0), (100, 0, 0)),     # Red
+    "system": (56, (255, 255, 255), (200, 200, 200), (50, 50, 50)),  # White to gray
+}
+
+
+def _x_overlap(a: Character, b: Character) -> bool:
+    """Check whether two characters overlap, for characters walking on the same path."""
+    return a.x < b.x + b.width and b.x < a.x + a.width
+
+
 class AnimationController:
     """Controls the animation state machine and character interactions."""
 
@@ -90,6 +126,12 @@ class AnimationController:
         # Subtitle animation tracking
         self.subtitle_start_time = 0
         self.subtitle_animation_offset = 0
+        self._fonts: Dict[int, pygame.font.Font] = {}
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+        self._gradient_cache: Dict[tuple, pygame.Surface] = {}
+        self._outlined_cache: Dict[tuple, pygame.Surface] = {}
+        self._rotation_source: Optional[pygame.Surface] = None
+        self._rotation_cache: Dict[int, pygame.Surface] = {}
         
         # Alien abduction tracking
         self.abduction_start_time = 0
@@ -106,18 +148,59 @@ class AnimationController:
         # Preload all dialogue and get durations
         self.dialogue_audio, self.dialogue_durations = self._preload_dialogues()
         
+        # Dialogue phases: line, fallback duration, pause after the line,
+        # characters who stop talking, and the transition to the next phase
+        self._dialogue_phases = {
+            AnimationPhase.COLLISION: (COLLISION_LINE, COLLISION_DIALOGUE_DURATION, 0,
+                                       (self.char1, self.char2), self._transition_to_kidding_dialogue),
+            AnimationPhase.KIDDING_DIALOGUE: (KIDDING_LINE, KIDDING_DIALOGUE_DURATION, 0,
+                                              (self.char1,), self._transition_to_hey_ya_dialogue),
+            AnimationPhase.HEY_YA_DIALOGUE: (HEY_YA_LINE, HEY_YA_DIALOGUE_DURATION, 0,
+                                             (self.char2,), self._transition_to_bump_sequence),
+            AnimationPhase.FINAL_DIALOGUE_1: (FINAL_LINE_1, FINAL_DIALOGUE_1_DURATION, 0,
+                                              (self.char1,), self._transition_to_final_dialogue_2),
+            # Wait 400ms after the last line before the abduction
+            AnimationPhase.FINAL_DIALOGUE_2: (FINAL_LINE_2, FINAL_DIALOGUE_2_DURATION, 400,
+                                              (self.char2,), self._transition_to_alien_abduction),
+        }
+
+        # Per-frame update handler for each phase
+        self._phase_handlers = {
+            AnimationPhase.CAT_RUN: self._update_cat_run,
+            AnimationPhase.WALKING_IN: self._update_walking_in,
+            AnimationPhase.COLLISION: self._update_dialogue_phase,
+            AnimationPhase.KIDDING_DIALOGUE: self._update_dialogue_phase,
+            AnimationPhase.HEY_YA_DIALOGUE: self._update_dialogue_phase,
+            AnimationPhase.BUMP_SEQUENCE: self._update_bump_sequence,
+            AnimationPhase.COLLISION_LOOP: self._update_collision_loop,
+            AnimationPhase.FINAL_DIALOGUE_1: self._update_dialogue_phase,
+            AnimationPhase.FINAL_DIALOGUE_2: self._update_dialogue_phase,
+            AnimationPhase.ALIEN_ABDUCTION: self._update_alien_abduction,
+            AnimationPhase.WALKING_OUT: self._update_walking_out,
+            AnimationPhase.FINISHED: self._update_finished,
+        }
+        
         # Expose AnimationPhase for external access
         self.AnimationPhase = AnimationPhase
 
-    def _preload_dialogues(self) -> tuple[Dict[str, pygame.mixer.Sound], Dict[str, int]]:
+    def _preload_dialogues(
+        self,
+    ) -> tuple[Dict[str, tuple[pygame.mixer.Sound, Optional[pygame.mixer.Sound]]], Dict[str, int]]:
         """Preload all dialogue audio and get their durations."""
         dialogues = [
-            ("WATCH IT!", "both", "nova"),
-            ("Just kidding, running into people is fun!", "char1", self.char1.voice),
-            ("Hey ya!", "char2", self.char2.voice),
-            ("Okay I have to go to work", "char1", self.char1.voice),
-            ("I don't care", "char2", self.char2.voice),
+            (COLLISION_LINE, "both", "nova"),
+            (KIDDING_LINE, "char1", self.char1.voice),
+            (HEY_YA_LINE, "char2", self.char2.voice),
+            (FINAL_LINE_1, "char1", self.char1.voice),
+            (FINAL_LINE_2, "char2", self.char2.voice),
         ]
+
+        # Compose every subtitle now so no line is rendered on its first visible frame
+        for text, speaker, _ in dialogues:
+            font_size, gradient_top, gradient_bottom, outline_color = DIALOGUE_STYLES[speaker]
+            self._create_outlined_text(text, self._get_font(font_size), gradient_top,
+                                       gradient_bottom, outline_color)
+
         return self.audio_manager.preload_dialogue(dialogues)
 
     def update(self, current_time: int) -> None:
@@ -127,30 +210,7 @@ class AnimationController:
         Args:
             current_time: Current time in milliseconds from pygame.time.get_ticks()
         """
-        if self.phase == AnimationPhase.CAT_RUN:
-            self._update_cat_run(current_time)
-        elif self.phase == AnimationPhase.WALKING_IN:
-            self._update_walking_in(current_time)
-        elif self.phase == AnimationPhase.COLLISION:
-            self._update_collision(current_time)
-        elif self.phase == AnimationPhase.KIDDING_DIALOGUE:
-            self._update_kidding_dialogue(current_time)
-        elif self.phase == AnimationPhase.HEY_YA_DIALOGUE:
-            self._update_hey_ya_dialogue(current_time)
-        elif self.phase == AnimationPhase.BUMP_SEQUENCE:
-            self._update_bump_sequence(current_time)
-        elif self.phase == AnimationPhase.COLLISION_LOOP:
-            self._update_collision_loop(current_time)
-        elif self.phase == AnimationPhase.FINAL_DIALOGUE_1:
-            self._update_final_dialogue_1(current_time)
-        elif self.phase == AnimationPhase.FINAL_DIALOGUE_2:
-            self._update_final_dialogue_2(current_time)
-        elif self.phase == AnimationPhase.ALIEN_ABDUCTION:
-            self._update_alien_abduction(current_time)
-        elif self.phase == AnimationPhase.WALKING_OUT:
-            self._update_walking_out(current_time)
-        elif self.phase == AnimationPhase.FINISHED:
-            self._update_finished()
+        self._phase_handlers[self.phase](current_time)
 
     def _update_cat_run(self, current_time: int) -> None:
         """Update cat run phase - cat runs across screen super fast."""
@@ -188,11 +248,11 @@ class AnimationController:
     def _transition_to_walking_in(self) -> None:
         """Transition to walking in phase."""
         self.phase = AnimationPhase.WALKING_IN
+        self.char1.set_walking(True)
+        self.char2.set_walking(True)
     
     def _update_walking_in(self, current_time: int) -> None:
         """Update walking in phase."""
-        self.char1.set_walking(True)
-        self.char2.set_walking(True)
         self.char1.move()
         self.char2.move()
 
@@ -201,8 +261,8 @@ class AnimationController:
 
         # Check if they're close to center and about to collide
         if (
-            self.char1.get_center_x() >= SCREEN_WIDTH // 2 - 50
-            and self.char2.get_center_x() <= SCREEN_WIDTH // 2 + 50
+            self.char1.get_center_x() >= COLLISION_ZONE_LEFT
+            and self.char2.get_center_x() <= COLLISION_ZONE_RIGHT
         ):
             self._transition_to_collision(current_time)
 
@@ -223,7 +283,7 @@ class AnimationController:
         self.audio_manager.stop_current_sound()
         self.dialogue_timer = current_time
         self.subtitle_start_time = current_time
-        self.current_dialogue = "WATCH IT!"
+        self.current_dialogue = COLLISION_LINE
         self.dialogue_speaker = "both"
 
         # Play collision sound effect
@@ -231,67 +291,55 @@ class AnimationController:
             self.collision_sound.play()
 
         # Play both character dialogue files simultaneously
-        if self.current_dialogue in self.dialogue_audio:
-            dialogue_sounds = self.dialogue_audio[self.current_dialogue]
-            if isinstance(dialogue_sounds, tuple):
-                # Play both sounds simultaneously
-                dialogue_sounds[0].play()
-                dialogue_sounds[1].play()
-            else:
-                self.audio_manager.play_sound(dialogue_sounds)
+        self._play_dialogue()
 
-    def _update_collision(self, current_time: int) -> None:
-        """Update collision phase."""
-        duration = self.dialogue_durations.get("WATCH IT!", COLLISION_DIALOGUE_DURATION)
-        if current_time - self.dialogue_timer > duration:
+    def _play_dialogue(self) -> None:
+        """Play the preloaded audio for the current dialogue line, if any."""
+        if self.current_dialogue not in self.dialogue_audio:
+            return
+        first, second = self.dialogue_audio[self.current_dialogue]
+        if second is None:
+            self.audio_manager.play_sound(first)
+        else:
+            # Both characters speak at once
+            first.play()
+            second.play()
+
+    def _update_dialogue_phase(self, current_time: int) -> None:
+        """Update a dialogue phase - move on once its line has finished playing."""
+        line, default_duration, pause, speakers, next_transition = self._dialogue_phases[self.phase]
+        duration = self.dialogue_durations.get(line, default_duration)
+        if current_time - self.dialogue_timer > duration + pause:
             # Stop talking
-            self.char1.set_talking(False)
-            self.char2.set_talking(False)
-            self._transition_to_kidding_dialogue(current_time)
+            for speaker in speakers:
+                speaker.set_talking(False)
+            next_transition(current_time)
 
     def _transition_to_kidding_dialogue(self, current_time: int) -> None:
         """Transition to kidding dialogue phase."""
         self.phase = AnimationPhase.KIDDING_DIALOGUE
         self.dialogue_timer = current_time
         self.subtitle_start_time = current_time
-        self.current_dialogue = "Just kidding, running into people is fun!"
+        self.current_dialogue = KIDDING_LINE
         self.dialogue_speaker = "char1"
         # Char1 talking
         self.char1.set_talking(True)
         self.char2.set_talking(False)
 
-        if self.current_dialogue in self.dialogue_audio:
-            self.audio_manager.play_sound(self.dialogue_audio[self.current_dialogue])
-
-    def _update_kidding_dialogue(self, current_time: int) -> None:
-        """Update kidding dialogue phase."""
-        duration = self.dialogue_durations.get("Just kidding, running into people is fun!", KIDDING_DIALOGUE_DURATION)
-        if current_time - self.dialogue_timer > duration:
-            # Stop talking
-            self.char1.set_talking(False)
-            self._transition_to_hey_ya_dialogue(current_time)
+        self._play_dialogue()
 
     def _transition_to_hey_ya_dialogue(self, current_time: int) -> None:
         """Transition to hey ya dialogue phase."""
         self.phase = AnimationPhase.HEY_YA_DIALOGUE
         self.dialogue_timer = current_time
         self.subtitle_start_time = current_time
-        self.current_dialogue = "Hey ya!"
+        self.current_dialogue = HEY_YA_LINE
         self.dialogue_speaker = "char2"
         # Char2 talking
         self.char1.set_talking(False)
         self.char2.set_talking(True)
 
-        if self.current_dialogue in self.dialogue_audio:
-            self.audio_manager.play_sound(self.dialogue_audio[self.current_dialogue])
-
-    def _update_hey_ya_dialogue(self, current_time: int) -> None:
-        """Update hey ya dialogue phase."""
-        duration = self.dialogue_durations.get("Hey ya!", HEY_YA_DIALOGUE_DURATION)
-        if current_time - self.dialogue_timer > duration:
-            # Stop talking
-            self.char2.set_talking(False)
-            self._transition_to_bump_sequence(current_time)
+        self._play_dialogue()
 
     def _transition_to_bump_sequence(self, current_time: int) -> None:
         """Transition to bump sequence phase."""
@@ -318,7 +366,7 @@ class AnimationController:
             self._manage_walking_sound()
             
             # Check for collision
-            if self.char1.get_rect().colliderect(self.char2.get_rect()):
+            if _x_overlap(self.char1, self.char2):
                 self.bump_count += 1
                 self.bump_state = "backing_up"
                 self.bump_timer = current_time
@@ -370,7 +418,7 @@ class AnimationController:
         self._manage_walking_sound()
 
         # Bounce off each other
-        if self.char1.get_rect().colliderect(self.char2.get_rect()):
+        if _x_overlap(self.char1, self.char2):
             self.char1.reverse_direction()
             self.char2.reverse_direction()
             # Small separation to prevent sticking
@@ -412,43 +460,24 @@ class AnimationController:
         self.audio_manager.stop_current_sound()
         self.dialogue_timer = current_time
         self.subtitle_start_time = current_time
-        self.current_dialogue = "Okay I have to go to work"
+        self.current_dialogue = FINAL_LINE_1
         self.dialogue_speaker = "char1"
 
-        if self.current_dialogue in self.dialogue_audio:
-            self.audio_manager.play_sound(self.dialogue_audio[self.current_dialogue])
-
-    def _update_final_dialogue_1(self, current_time: int) -> None:
-        """Update final dialogue 1 phase."""
-        duration = self.dialogue_durations.get("Okay I have to go to work", FINAL_DIALOGUE_1_DURATION)
-        if current_time - self.dialogue_timer > duration:
-            # Stop talking
-            self.char1.set_talking(False)
-            self._transition_to_final_dialogue_2(current_time)
+        self._play_dialogue()
 
     def _transition_to_final_dialogue_2(self, current_time: int) -> None:
         """Transition to final dialogue 2 phase."""
         self.phase = AnimationPhase.FINAL_DIALOGUE_2
         self.dialogue_timer = current_time
         self.subtitle_start_time = current_time
-        self.current_dialogue = "I don't care"
+        self.current_dialogue = FINAL_LINE_2
         self.dialogue_speaker = "char2"
         # Char2 talking
         self.char1.set_talking(False)
         self.char2.set_talking(True)
 
-        if self.current_dialogue in self.dialogue_audio:
-            self.audio_manager.play_sound(self.dialogue_audio[self.current_dialogue])
+        self._play_dialogue()
 
-    def _update_final_dialogue_2(self, current_time: int) -> None:
-        """Update final dialogue 2 phase."""
-        duration = self.dialogue_durations.get("I don't care", FINAL_DIALOGUE_2_DURATION)
-        # Wait 400ms after dialogue ends before abduction
-        if current_time - self.dialogue_timer > duration + 400:
-            # Stop talking
-            self.char2.set_talking(False)
-            self._transition_to_alien_abduction(current_time)
-    
     def _transition_to_alien_abduction(self, current_time: int) -> None:
         """Transition to alien abduction phase."""
         self.phase = AnimationPhase.ALIEN_ABDUCTION
@@ -530,10 +559,10 @@ class AnimationController:
         self.audio_manager.stop_current_sound()
         self.finished_time = None
 
-    def _update_finished(self) -> None:
+    def _update_finished(self, current_time: int) -> None:
         """Update finished phase - marks time for auto-close."""
         if self.finished_time is None:
-            self.finished_time = pygame.time.get_ticks()
+            self.finished_time = current_time
         # No dialogue shown, animation will auto-close
         self.current_dialogue = ""
         self.dialogue_speaker = ""
@@ -558,6 +587,26 @@ class AnimationController:
             if self.walking_sound and self.audio_manager.is_sound_playing(self.walking_sound):
                 self.audio_manager.stop_current_sound()
 
+    def _get_font(self, font_size: int) -> pygame.font.Font:
+        """Return the default font at the given size, loading it on first use."""
+        font = self._fonts.get(font_size)
+        if font is None:
+            font = self._fonts[font_size] = pygame.font.Font(None, font_size)
+        return font
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render text once per (text, font size, color) and reuse the surface.
+
+        Callers must not draw onto the returned surface, since it is shared.
+        """
+        key = (text, font.get_height(), color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
     def _create_gradient_surface(self, text: str, font: pygame.font.Font,
                                  color_top: tuple, color_bottom: tuple) -> pygame.Surface:
         """
@@ -570,74 +619,93 @@ class AnimationController:
             color_bottom: RGB color for bottom of gradient
             
         Returns:
-            Surface with gradient text
+            Surface with gradient text, cached per text, font size and colors
         """
+        key = (text, font.get_height(), color_top, color_bottom)
+        cached = self._gradient_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Create base text surface
-        text_surface = font.render(text, True, (255, 255, 255))
+        text_surface = self._render_text(font, text, (255, 255, 255))
         width, height = text_surface.get_size()
         
-        # Create gradient surface
+        # Vertical gradient, built as one color column and broadcast across the width
+        ratio = np.arange(height)[:, None] / height
+        column = (np.array(color_top) * (1 - ratio) + np.array(color_bottom) * ratio).astype(np.uint8)
         gradient_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        
-        # Draw gradient
-        for y in range(height):
-            # Interpolate between top and bottom colors
-            ratio = y / height
-            r = int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio)
-            g = int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio)
-            b = int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
-            pygame.draw.line(gradient_surface, (r, g, b), (0, y), (width, y))
+        pygame.surfarray.blit_array(gradient_surface, np.broadcast_to(column, (width, height, 3)))
         
         # Apply text as alpha mask
         gradient_surface.blit(text_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
         
+        self._gradient_cache[key] = gradient_surface
         return gradient_surface
 
-    def draw_dialogue(self, screen: pygame.Surface) -> None:
+    def _create_outlined_text(self, text: str, font: pygame.font.Font, color_top: tuple,
+                              color_bottom: tuple, outline_color: tuple) -> pygame.Surface:
+        """
+        Create gradient text with an outline.
+
+        The result is cached per text, font size and colors; callers must not draw onto it.
+        """
+        key = (text, font.get_height(), color_top, color_bottom, outline_color)
+        cached = self._outlined_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Size the surface to the text plus its outline; rotate() grows it as needed
+        width, height = self._render_text(font, text, (255, 255, 255)).get_size()
+        render_surface = pygame.Surface((width + 2 * OUTLINE_THICKNESS, height + 2 * OUTLINE_THICKNESS),
+                                        pygame.SRCALPHA)
+        render_center = render_surface.get_rect().center
+        
+        # Draw outline by blitting the text at every offset around the fill
+        outline_surface = self._render_text(font, text, outline_color)
+        for offset_x, offset_y in OUTLINE_OFFSETS:
+            outline_rect = outline_surface.get_rect(center=(render_center[0] + offset_x,
+                                                            render_center[1] + offset_y))
+            render_surface.blit(outline_surface, outline_rect)
+        
+        # Draw gradient fill text on render surface
+        gradient_text = self._create_gradient_surface(text, font, color_top, color_bottom)
+        gradient_rect = gradient_text.get_rect(center=render_center)
+        render_surface.blit(gradient_text, gradient_rect)
+        
+        self._outlined_cache[key] = render_surface
+        return render_surface
+
+    def draw_dialogue(self, screen: pygame.Surface, current_time: Optional[int] = None) -> None:
         """
         Draw the current dialogue on screen with enhanced styling and animations.
 
         Args:
             screen: Pygame surface to draw on
+            current_time: Time in milliseconds on the same clock passed to update();
+                defaults to pygame.time.get_ticks()
         """
         if not self.current_dialogue:
             return
 
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         time_since_start = current_time - self.subtitle_start_time
         
-        # Larger font sizes
-        font_size = 64 if self.dialogue_speaker == "both" else 48
-        if self.dialogue_speaker == "system":
-            font_size = 56
-
-        font = pygame.font.Font(None, font_size)
+        # Font size and colors for the speaker; only the position depends on live state
+        font_size, gradient_top, gradient_bottom, outline_color = DIALOGUE_STYLES.get(
+            self.dialogue_speaker, DIALOGUE_STYLES["system"])
+        font = self._get_font(font_size)
         
-        # Determine colors and position based on speaker
         if self.dialogue_speaker == "both":
-            gradient_top = (255, 100, 100)  # Light red
-            gradient_bottom = (200, 0, 0)   # Dark red
-            outline_color = (100, 0, 0)     # Very dark red
             base_center = (SCREEN_WIDTH // 2, 100)
         elif self.dialogue_speaker == "char1":
-            gradient_top = (100, 150, 255)  # Light blue
-            gradient_bottom = (0, 50, 200)  # Dark blue
-            outline_color = (0, 0, 100)     # Very dark blue
             base_center = (self.char1.get_center_x(), self.char1.y - 80)
         elif self.dialogue_speaker == "char2":
-            gradient_top = (255, 100, 100)  # Light red
-            gradient_bottom = (200, 0, 0)   # Dark red
-            outline_color = (100, 0, 0)     # Very dark red
             base_center = (self.char2.get_center_x(), self.char2.y - 80)
         else:  # system
-            gradient_top = (255, 255, 255)  # White
-            gradient_bottom = (200, 200, 200)  # Light gray
-            outline_color = (50, 50, 50)    # Dark gray
             base_center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
 
         # Animation effects
-        import math
-        
         # 1. Bounce-in effect (first 300ms)
         bounce_duration = 300
         if time_since_start < bounce_duration:
@@ -664,35 +732,9 @@ class AnimationController:
             int(base_center[1] + float_offset_y)
         )
         
-        # Create outline by rendering text multiple times with offset
-        outline_thickness = 3
-        outline_offsets = []
-        for x in range(-outline_thickness, outline_thickness + 1):
-            for y in range(-outline_thickness, outline_thickness + 1):
-                if x != 0 or y != 0:
-                    outline_offsets.append((x, y))
-        
-        # Render base text for sizing
-        temp_surface = font.render(self.current_dialogue, True, (255, 255, 255))
-        original_rect = temp_surface.get_rect(center=animated_center)
-        
-        # Create a larger surface to accommodate rotation and scaling
-        max_dimension = int(max(original_rect.width, original_rect.height) * 1.5)
-        render_surface = pygame.Surface((max_dimension, max_dimension), pygame.SRCALPHA)
-        render_center = (max_dimension // 2, max_dimension // 2)
-        
-        # Draw outline on render surface
-        for offset_x, offset_y in outline_offsets:
-            outline_surface = font.render(self.current_dialogue, True, outline_color)
-            outline_rect = outline_surface.get_rect(center=(render_center[0] + offset_x,
-                                                            render_center[1] + offset_y))
-            render_surface.blit(outline_surface, outline_rect)
-        
-        # Draw gradient fill text on render surface
-        gradient_text = self._create_gradient_surface(self.current_dialogue, font,
-                                                      gradient_top, gradient_bottom)
-        gradient_rect = gradient_text.get_rect(center=render_center)
-        render_surface.blit(gradient_text, gradient_rect)
+        # Outlined gradient text, composed once per line and style
+        render_surface = self._create_outlined_text(self.current_dialogue, font, gradient_top,
+                                                    gradient_bottom, outline_color)
         
         # Apply scale
         if scale != 1.0:
@@ -700,12 +742,24 @@ class AnimationController:
             new_height = int(render_surface.get_height() * scale)
             render_surface = pygame.transform.scale(render_surface, (new_width, new_height))
         
-        # Apply rotation
-        if rotation_angle != 0:
+        # Apply rotation; once the bounce-in settles, reuse rotations quantized to 0.1 degrees
+        if time_since_start >= bounce_duration:
+            if self._rotation_source is not render_surface:
+                self._rotation_source = render_surface
+                self._rotation_cache.clear()
+            angle_step = round(rotation_angle * 10)
+            rotated = self._rotation_cache.get(angle_step)
+            if rotated is None:
+                rotated = pygame.transform.rotate(render_surface, angle_step / 10)
+                self._rotation_cache[angle_step] = rotated
+            render_surface = rotated
+        elif rotation_angle != 0:
             render_surface = pygame.transform.rotate(render_surface, rotation_angle)
         
-        # Apply alpha
+        # Apply alpha, without touching the cached untransformed surface
         if alpha < 255:
+            if scale == 1.0 and rotation_angle == 0:
+                render_surface = render_surface.copy()
             render_surface.set_alpha(alpha)
         
         # Blit to screen centered at animated position
@@ -1,7 +1,8 @@
 """Audio management for TTS and sound effects."""
 
+import functools
 import io
-import os
+import subprocess
 import threading
 from typing import Optional, Dict
 
@@ -14,15 +15,38 @@ from .config import (
     WALKING_SOUND_FREQUENCY,
     WALKING_SOUND_DURATION,
     APPLE_CONNECT_COMMAND,
+    APPLE_CONNECT_TIMEOUT,
     FLOODGATE_BASE_URL,
 )
 
+# Mapping of dialogue text to file paths
+DIALOGUE_FILES = {
+    "WATCH IT!_char1": "assets/01_01_watch_it.wav",
+    "WATCH IT!_char2": "assets/01_02_watch_it.wav",
+    "Just kidding, running into people is fun!": "assets/02_01_just_kidding.wav",
+    "Hey ya!": "assets/03_02_hey_ya.wav",
+    "Okay I have to go to work": "assets/04_01_go_to_work.wav",
+    "I don't care": "assets/05_02_i_dont_care.wav",
+}
 
+
+@functools.cache
 def setup_openai_client() -> Optional[OpenAI]:
-    """Set up OpenAI client with Apple internal authentication."""
+    """
+    Set up OpenAI client with Apple internal authentication.
+
+    Authentication runs once per process; every AudioManager shares the result.
+    """
     try:
         print("Attempting to authenticate with Apple Floodgate...")
-        token_output = os.popen(APPLE_CONNECT_COMMAND).read()
+        # Run appleconnect directly (no shell) and give up if it hangs
+        try:
+            token_output = subprocess.run(
+                APPLE_CONNECT_COMMAND, stdout=subprocess.PIPE, text=True,
+                timeout=APPLE_CONNECT_TIMEOUT, check=False,
+            ).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            token_output = ""
         
         if not token_output or token_output.strip() == "":
             print("Warning: No token received from appleconnect command")
@@ -53,6 +77,10 @@ class AudioManager:
         """Initialize the audio manager."""
         self.audio_cache: Dict[str, pygame.mixer.Sound] = {}
         self.current_sound: Optional[pygame.mixer.Sound] = None
+        self.current_channel: Optional[pygame.mixer.Channel] = None
+        # Reserve a channel for looping sounds so sound effects and dialogue can never take it
+        pygame.mixer.set_reserved(1)
+        self.loop_channel = pygame.mixer.Channel(0)
         self.openai_client = setup_openai_client()
 
     def generate_tts_audio(
@@ -143,13 +171,13 @@ class AudioManager:
             # Generate a simple click sound for footsteps
             t = np.linspace(0, WALKING_SOUND_DURATION, frames)
             # Decaying sine wave for a thump sound
-            wave = np.sin(WALKING_SOUND_FREQUENCY * 2 * np.pi * t) * np.exp(-t * 20)
+            wave = np.sin(WALKING_SOUND_FREQUENCY * 2 * np.pi * t)
+            wave *= np.exp(-t * 20)
+            wave *= 32767
 
-            # Convert to pygame sound format
-            wave = (wave * 32767).astype(np.int16)
-            stereo_wave = np.column_stack((wave, wave))
-            # Ensure C-contiguous array
-            stereo_wave = np.ascontiguousarray(stereo_wave)
+            # Convert to pygame sound format, writing both channels straight into a C-contiguous buffer
+            stereo_wave = np.empty((frames, 2), dtype=np.int16)
+            stereo_wave[:] = wave[:, None]
             sound = pygame.sndarray.make_sound(stereo_wave)
 
             return sound
@@ -170,7 +198,7 @@ class AudioManager:
         if sound:
             try:
                 self.current_sound = sound
-                sound.play()
+                self.current_channel = sound.play()
             except Exception as e:
                 print(f"Error playing sound: {e}")
 
@@ -184,7 +212,8 @@ class AudioManager:
         if sound:
             try:
                 self.current_sound = sound
-                sound.play(loops=-1)  # -1 means loop indefinitely
+                self.loop_channel.play(sound, loops=-1)  # -1 means loop indefinitely
+                self.current_channel = self.loop_channel
             except Exception as e:
                 print(f"Error playing looping sound: {e}")
 
@@ -193,6 +222,7 @@ class AudioManager:
         if self.current_sound:
             self.current_sound.stop()
             self.current_sound = None
+            self.current_channel = None
     
     def is_sound_playing(self, sound: Optional[pygame.mixer.Sound]) -> bool:
         """
@@ -204,8 +234,9 @@ class AudioManager:
         Returns:
             True if the sound is playing, False otherwise
         """
-        if sound and self.current_sound == sound:
-            return sound.get_num_channels() > 0
+        if sound and self.current_sound == sound and self.current_channel:
+            # Ask the one channel it was started on rather than scanning every channel
+            return self.current_channel.get_busy() and self.current_channel.get_sound() == sound
         return False
 
     def load_dialogue_file(self, filepath: str) -> Optional[pygame.mixer.Sound]:
@@ -227,7 +258,7 @@ class AudioManager:
 
     def preload_dialogue(
         self, dialogues: list[tuple[str, str, str]]
-    ) -> tuple[Dict[str, pygame.mixer.Sound], Dict[str, int]]:
+    ) -> tuple[Dict[str, tuple[pygame.mixer.Sound, Optional[pygame.mixer.Sound]]], Dict[str, int]]:
         """
         Preload all dialogue audio from files.
 
@@ -235,27 +266,18 @@ class AudioManager:
             dialogues: List of (text, speaker, voice) tuples
 
         Returns:
-            Tuple of (Dictionary mapping text to Sound objects, Dictionary mapping text to duration in ms)
+            Tuple of (Dictionary mapping text to a (first, second) Sound pair, Dictionary mapping text to duration in ms).
+            Single-speaker lines have None as the second sound.
         """
         dialogue_audio = {}
         dialogue_durations = {}
         
-        # Mapping of dialogue text to file paths
-        dialogue_files = {
-            "WATCH IT!_char1": "assets/01_01_watch_it.wav",
-            "WATCH IT!_char2": "assets/01_02_watch_it.wav",
-            "Just kidding, running into people is fun!": "assets/02_01_just_kidding.wav",
-            "Hey ya!": "assets/03_02_hey_ya.wav",
-            "Okay I have to go to work": "assets/04_01_go_to_work.wav",
-            "I don't care": "assets/05_02_i_dont_care.wav",
-        }
-        
         print("\nLoading dialogue audio files...")
         for text, speaker, _ in dialogues:
             if text == "WATCH IT!":
                 # Load both character versions for simultaneous playback
-                char1_sound = self.load_dialogue_file(dialogue_files["WATCH IT!_char1"])
-                char2_sound = self.load_dialogue_file(dialogue_files["WATCH IT!_char2"])
+                char1_sound = self.load_dialogue_file(DIALOGUE_FILES["WATCH IT!_char1"])
+                char2_sound = self.load_dialogue_file(DIALOGUE_FILES["WATCH IT!_char2"])
                 if char1_sound and char2_sound:
                     # Store both sounds as a tuple
                     dialogue_audio[text] = (char1_sound, char2_sound)
@@ -268,10 +290,10 @@ class AudioManager:
                     print(f"✓ Loaded: {text} (both characters, {duration}ms)")
             else:
                 # Load single character dialogue
-                if text in dialogue_files:
-                    sound = self.load_dialogue_file(dialogue_files[text])
+                if text in DIALOGUE_FILES:
+                    sound = self.load_dialogue_file(DIALOGUE_FILES[text])
                     if sound:
-                        dialogue_audio[text] = sound
+                        dialogue_audio[text] = (sound, None)
                         duration = int(sound.get_length() * 1000)
                         dialogue_durations[text] = duration
                         print(f"✓ Loaded: {text} ({duration}ms)")
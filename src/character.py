@@ -12,6 +12,18 @@ from .config import (
     EYE_SIZE,
 )
 
+_DEG_TO_RAD = math.pi / 180  # Same factor math.radians() multiplies by
+
+# Box that holds the whole figure in any pose: size and where the head center sits in it
+_FIGURE_SIZE = (140, 170)
+_FIGURE_ORIGIN = (70, 60)
+
+# Pre-rendered head, eyes and features: surface size and where the head center sits on it
+_HEAD_SPRITE_SIZE = (100, 100)
+_HEAD_SPRITE_ORIGIN = (50, 50)
+
+_TORSO_LENGTH = 35  # Neck to hips
+
 
 class Character:
     """Represents an animated stick figure character with advanced animations."""
@@ -44,74 +56,49 @@ class Character:
         self.walk_frame = 0
         self.talk_frame = 0
         self.body_thickness = 4  # Thickness of body lines
+        self._idle_sprites: dict[bool, pygame.Surface] = {}  # Standing pose, keyed by is_smiling
         
         # Character archetype based on color
         self.is_blue = (color == (0, 0, 255) or color[2] > color[0])  # Blue = bro type
         self.is_red = (color == (255, 0, 0) or color[0] > color[2])   # Red = pop star type
 
-    def _draw_gradient_circle(self, screen: pygame.Surface, center: tuple, radius: int,
-                             color_inner: tuple, color_outer: tuple) -> None:
-        """Draw a circle with radial gradient."""
-        for r in range(radius, 0, -1):
-            ratio = r / radius
-            # Interpolate between outer and inner colors
-            r_val = int(color_outer[0] * ratio + color_inner[0] * (1 - ratio))
-            g_val = int(color_outer[1] * ratio + color_inner[1] * (1 - ratio))
-            b_val = int(color_outer[2] * ratio + color_inner[2] * (1 - ratio))
-            pygame.draw.circle(screen, (r_val, g_val, b_val), center, r)
-    
-    def _draw_glow(self, screen: pygame.Surface, center: tuple, radius: int, color: tuple) -> None:
-        """Draw a glowing effect around a point."""
-        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-        for i in range(3):
-            alpha = 30 - i * 10
-            glow_radius = radius + i * 8
-            glow_color = (*color, alpha)
-            pygame.draw.circle(glow_surface, glow_color, (radius * 2, radius * 2), glow_radius)
-        screen.blit(glow_surface, (center[0] - radius * 2, center[1] - radius * 2))
+        # Lighter and darker versions of color for gradients; the color never changes
+        self._color_light = tuple(min(255, c + 80) for c in color)
+        self._color_dark = tuple(max(0, c - 40) for c in color)
 
-    def draw(self, screen: pygame.Surface) -> None:
+        # Parts that look the same every frame are pre-rendered once
+        self._head_sprite = self._build_head_sprite()
+        self._hand_sprite = self._build_sparkle_sprite([(self._color_light, 5), (color, 4)])
+        self._foot_sprite = self._build_sparkle_sprite([(self._color_light, 5), (color, 4),
+                                                        (self._color_dark, 2)])
+        self._torso_glow = self._build_glow_sprite(20, 8, 40)
+        self._foot_glow = self._build_glow_sprite(16, 7, 60)
+
+        # Torso gradient: one 1px vertical stroke per column, neck to hips inclusive
+        self._torso_sprite = pygame.Surface((self.body_thickness, _TORSO_LENGTH + 1))
+        for i in range(self.body_thickness):
+            offset = i - self.body_thickness // 2
+            ratio = abs(offset) / (self.body_thickness / 2)
+            line_color = tuple(int(color[j] * (1 - ratio * 0.3) + self._color_light[j] * ratio * 0.3) for j in range(3))
+            pygame.draw.line(self._torso_sprite, line_color, (i, 0), (i, _TORSO_LENGTH), 1)
+        self._torso_sprite = self._torso_sprite.convert()
+
+    def _build_head_sprite(self) -> pygame.Surface:
         """
-        Draw the character as a whimsical, stylized stick figure.
+        Render the head, eyes and archetype features, none of which change between frames.
 
-        Args:
-            screen: Pygame surface to draw on
+        The head center sits at _HEAD_SPRITE_ORIGIN on the returned surface.
         """
-        # Calculate animation parameters
-        walk_cycle = (self.walk_frame / 15) % (2 * math.pi) if self.is_walking else 0
-        bob_offset = int(3 * abs(math.sin(walk_cycle))) if self.is_walking else 0
-        
-        if self.is_walking:
-            self.walk_frame += 1
+        head = pygame.Surface(_HEAD_SPRITE_SIZE, pygame.SRCALPHA)
+        head_x, head_y = _HEAD_SPRITE_ORIGIN
+        color_dark = self._color_dark
 
-        # Idle animation - gentle breathing/floating
-        idle_float = int(2 * math.sin(self.walk_frame / 30))
-        
-        # Base positions
-        center_x = int(self.x + self.width // 2)
-        base_y = int(self.y + self.height)
-        
-        # Head position with bobbing and floating
-        head_x = center_x
-        head_y = int(self.y - HEAD_RADIUS - bob_offset + idle_float)
-        
-        # Torso positions
-        neck_y = head_y + HEAD_RADIUS
-        torso_bottom_y = neck_y + 35
-        
-        # Hip position
-        hip_y = torso_bottom_y
-        
-        # Create lighter and darker versions of color for gradients
-        color_light = tuple(min(255, c + 80) for c in self.color)
-        color_dark = tuple(max(0, c - 40) for c in self.color)
-        
         # Draw head with gradient (no glow)
-        self._draw_gradient_circle(screen, (head_x, head_y), HEAD_RADIUS, color_light, self.color)
+        self._draw_gradient_circle(head, (head_x, head_y), HEAD_RADIUS, self._color_light, self.color)
         
         # Draw sparkly outline on head
-        pygame.draw.circle(screen, color_light, (head_x, head_y), HEAD_RADIUS, 3)
-        pygame.draw.circle(screen, BLACK, (head_x, head_y), HEAD_RADIUS, 1)
+        pygame.draw.circle(head, self._color_light, (head_x, head_y), HEAD_RADIUS, 3)
+        pygame.draw.circle(head, BLACK, (head_x, head_y), HEAD_RADIUS, 1)
         
         # Draw sparkly eyes with shine (before character features so eyelashes can reference them)
         left_eye_x = head_x - 7
@@ -119,12 +106,12 @@ class Character:
         eye_y = head_y - 4
         
         # Main eye
-        pygame.draw.circle(screen, BLACK, (left_eye_x, eye_y), EYE_SIZE)
-        pygame.draw.circle(screen, BLACK, (right_eye_x, eye_y), EYE_SIZE)
+        pygame.draw.circle(head, BLACK, (left_eye_x, eye_y), EYE_SIZE)
+        pygame.draw.circle(head, BLACK, (right_eye_x, eye_y), EYE_SIZE)
         
         # Eye shine (white highlight)
-        pygame.draw.circle(screen, (255, 255, 255), (left_eye_x - 1, eye_y - 1), 2)
-        pygame.draw.circle(screen, (255, 255, 255), (right_eye_x - 1, eye_y - 1), 2)
+        pygame.draw.circle(head, (255, 255, 255), (left_eye_x - 1, eye_y - 1), 2)
+        pygame.draw.circle(head, (255, 255, 255), (right_eye_x - 1, eye_y - 1), 2)
         
         # Add character-specific features
         if self.is_blue:
@@ -144,14 +131,14 @@ class Character:
                 (head_x + cap_width // 2 - 4, cap_y - cap_height),
                 (head_x + cap_width // 2, cap_y)
             ]
-            pygame.draw.polygon(screen, color_dark, cap_points)
-            pygame.draw.polygon(screen, BLACK, cap_points, 2)
+            pygame.draw.polygon(head, color_dark, cap_points)
+            pygame.draw.polygon(head, BLACK, cap_points, 2)
             
             # Text on cap "sup lol" (bigger)
             font = pygame.font.Font(None, 20)
             cap_text = font.render("sup lol", True, (255, 255, 255))
             text_rect = cap_text.get_rect(center=(head_x, cap_y - cap_height // 2))
-            screen.blit(cap_text, text_rect)
+            head.blit(cap_text, text_rect)
             
             # Cap bill (longer and more prominent)
             bill_length = 30
@@ -161,14 +148,14 @@ class Character:
                 (head_x - bill_length - 4, cap_y + 10),
                 (head_x - 4, cap_y + 6)
             ]
-            pygame.draw.polygon(screen, color_dark, bill_points)
-            pygame.draw.polygon(screen, BLACK, bill_points, 2)
+            pygame.draw.polygon(head, color_dark, bill_points)
+            pygame.draw.polygon(head, BLACK, bill_points, 2)
             
             # Add some detail lines on bill for realism
-            pygame.draw.line(screen, BLACK,
+            pygame.draw.line(head, BLACK,
                            (head_x - 8, cap_y + 2),
                            (head_x - bill_length - 6, cap_y + 6), 1)
-            pygame.draw.line(screen, BLACK,
+            pygame.draw.line(head, BLACK,
                            (head_x - 6, cap_y + 4),
                            (head_x - bill_length - 4, cap_y + 8), 1)
             
@@ -176,13 +163,8 @@ class Character:
             for bx in range(-8, 9, 3):
                 for by in range(3, 10, 3):
                     if abs(bx) + by < 14:
-                        pygame.draw.circle(screen, BLACK, (head_x + bx, head_y + by), 1)
-            
-            # Muscular build indicator (wider shoulders)
-            shoulder_width_bonus = 8
-        else:
-            shoulder_width_bonus = 0
-            
+                        pygame.draw.circle(head, BLACK, (head_x + bx, head_y + by), 1)
+
         if self.is_red:
             # Pop star/celebrity features
             # Long hair
@@ -191,39 +173,131 @@ class Character:
             for i in range(5):
                 hair_x = head_x - HEAD_RADIUS + i * 2
                 hair_length = 25 + i * 3
-                pygame.draw.line(screen, hair_color,
+                pygame.draw.line(head, hair_color,
                                (hair_x, head_y - HEAD_RADIUS + 5),
                                (hair_x - 8, head_y + hair_length), 3)
             # Right side hair
             for i in range(5):
                 hair_x = head_x + HEAD_RADIUS - i * 2
                 hair_length = 25 + i * 3
-                pygame.draw.line(screen, hair_color,
+                pygame.draw.line(head, hair_color,
                                (hair_x, head_y - HEAD_RADIUS + 5),
                                (hair_x + 8, head_y + hair_length), 3)
             
             # Sparkly headband/accessory
             headband_y = head_y - HEAD_RADIUS + 2
-            pygame.draw.line(screen, (255, 215, 0),
+            pygame.draw.line(head, (255, 215, 0),
                            (head_x - HEAD_RADIUS, headband_y),
                            (head_x + HEAD_RADIUS, headband_y), 3)
             # Sparkles on headband
             for sx in range(-HEAD_RADIUS, HEAD_RADIUS, 8):
-                pygame.draw.circle(screen, (255, 255, 255), (head_x + sx, headband_y), 2)
+                pygame.draw.circle(head, (255, 255, 255), (head_x + sx, headband_y), 2)
             
             # Eyelashes
             for i in range(3):
                 lash_offset = -3 + i * 3
-                pygame.draw.line(screen, BLACK,
+                pygame.draw.line(head, BLACK,
                                (left_eye_x + lash_offset, eye_y - EYE_SIZE - 1),
                                (left_eye_x + lash_offset - 1, eye_y - EYE_SIZE - 4), 1)
-                pygame.draw.line(screen, BLACK,
+                pygame.draw.line(head, BLACK,
                                (right_eye_x + lash_offset, eye_y - EYE_SIZE - 1),
                                (right_eye_x + lash_offset - 1, eye_y - EYE_SIZE - 4), 1)
-            
-            shoulder_width_bonus = -4  # Slimmer build
-        else:
-            shoulder_width_bonus = 0
+
+        return head.convert_alpha()
+
+    def _build_sparkle_sprite(self, rings: list[tuple[tuple, int]]) -> pygame.Surface:
+        """Render filled (color, radius) circles, outermost first, centered on a transparent surface."""
+        radius = rings[0][1]
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        for color, r in rings:
+            pygame.draw.circle(sprite, color, (radius + 1, radius + 1), r)
+        return sprite.convert_alpha()
+
+    def _build_glow_sprite(self, size: int, radius: int, alpha: int) -> pygame.Surface:
+        """Render a translucent circle in the character's color, centered on a size x size surface."""
+        glow = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(glow, (*self.color, alpha), (size // 2, size // 2), radius)
+        return glow.convert_alpha()
+
+    def _draw_gradient_circle(self, screen: pygame.Surface, center: tuple, radius: int,
+                             color_inner: tuple, color_outer: tuple) -> None:
+        """Draw a circle with radial gradient."""
+        for r in range(radius, 0, -1):
+            ratio = r / radius
+            # Interpolate between outer and inner colors
+            r_val = int(color_outer[0] * ratio + color_inner[0] * (1 - ratio))
+            g_val = int(color_outer[1] * ratio + color_inner[1] * (1 - ratio))
+            b_val = int(color_outer[2] * ratio + color_inner[2] * (1 - ratio))
+            pygame.draw.circle(screen, (r_val, g_val, b_val), center, r)
+    
+    def _draw_glow(self, screen: pygame.Surface, center: tuple, radius: int, color: tuple) -> None:
+        """Draw a glowing effect around a point."""
+        glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+        for i in range(3):
+            alpha = 30 - i * 10
+            glow_radius = radius + i * 8
+            glow_color = (*color, alpha)
+            pygame.draw.circle(glow_surface, glow_color, (radius * 2, radius * 2), glow_radius)
+        screen.blit(glow_surface, (center[0] - radius * 2, center[1] - radius * 2))
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw the character as a whimsical, stylized stick figure.
+
+        Args:
+            screen: Pygame surface to draw on
+        """
+        # Calculate animation parameters
+        walk_cycle = (self.walk_frame / 15) % (2 * math.pi) if self.is_walking else 0
+        # Walk-cycle swing, shared by the bob, arms and legs
+        swing = math.sin(walk_cycle)
+        bob_offset = int(3 * abs(swing)) if self.is_walking else 0
+        
+        if self.is_walking:
+            self.walk_frame += 1
+
+        # Idle animation - gentle breathing/floating
+        idle_float = int(2 * math.sin(self.walk_frame / 30))
+        
+        # Base positions
+        center_x = int(self.x + self.width // 2)
+        
+        # Head position with bobbing and floating
+        head_y = int(self.y - HEAD_RADIUS - bob_offset + idle_float)
+
+        # Off-screen figures draw nothing; only the talk animation has to keep counting
+        bounds = pygame.Rect(center_x - _FIGURE_ORIGIN[0], head_y - _FIGURE_ORIGIN[1], *_FIGURE_SIZE)
+        if not screen.get_clip().colliderect(bounds):
+            if self.is_talking:
+                self.talk_frame += 1
+            return
+
+        # Standing still and silent, the figure only ever moves as a whole, so blit a cached copy
+        if not self.is_walking and not self.is_talking:
+            sprite = self._idle_sprites.get(self.is_smiling)
+            if sprite is None:
+                sprite = pygame.Surface(_FIGURE_SIZE, pygame.SRCALPHA)
+                self._draw_figure(sprite, _FIGURE_ORIGIN[0], _FIGURE_ORIGIN[1], walk_cycle, swing)
+                sprite = self._idle_sprites[self.is_smiling] = sprite.convert_alpha()
+            screen.blit(sprite, (center_x - _FIGURE_ORIGIN[0], head_y - _FIGURE_ORIGIN[1]))
+            return
+
+        self._draw_figure(screen, center_x, head_y, walk_cycle, swing)
+
+    def _draw_figure(self, screen: pygame.Surface, center_x: int, head_y: int,
+                     walk_cycle: float, swing: float) -> None:
+        """Draw the figure with its head centered at (center_x, head_y)."""
+        head_x = center_x
+        
+        # Torso positions
+        neck_y = head_y + HEAD_RADIUS
+        torso_bottom_y = neck_y + _TORSO_LENGTH
+        
+        # Hip position
+        hip_y = torso_bottom_y
+        
+        # Draw the head with its eyes and archetype features, pre-rendered once
+        screen.blit(self._head_sprite, (head_x - _HEAD_SPRITE_ORIGIN[0], head_y - _HEAD_SPRITE_ORIGIN[1]))
         
         # Draw mouth - ALWAYS smiling (never frowning!)
         if self.is_talking:
@@ -248,24 +322,17 @@ class Character:
             mouth_rect = pygame.Rect(head_x - 8, head_y + 5, 16, 8)
             pygame.draw.arc(screen, BLACK, mouth_rect, 0, math.pi, 2)
         
-        # Draw torso with gradient effect (multiple lines)
-        for i in range(self.body_thickness):
-            offset = i - self.body_thickness // 2
-            ratio = abs(offset) / (self.body_thickness / 2)
-            line_color = tuple(int(self.color[j] * (1 - ratio * 0.3) + color_light[j] * ratio * 0.3) for j in range(3))
-            pygame.draw.line(screen, line_color, (center_x + offset, neck_y), (center_x + offset, torso_bottom_y), 1)
+        # Draw torso with gradient effect (pre-rendered strip)
+        screen.blit(self._torso_sprite, (center_x - self.body_thickness // 2, neck_y))
         
         # Add glow to torso
-        glow_points = [(center_x, neck_y + 10), (center_x, torso_bottom_y - 10)]
-        for point in glow_points:
-            glow_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (*self.color, 40), (10, 10), 8)
-            screen.blit(glow_surf, (point[0] - 10, point[1] - 10))
+        screen.blit(self._torso_glow, (center_x - 10, neck_y))
+        screen.blit(self._torso_glow, (center_x - 10, torso_bottom_y - 20))
         
         # Animated arms
         if self.is_walking:
             # Arms swing opposite to legs
-            arm_swing = math.sin(walk_cycle) * 25
+            arm_swing = swing * 25
             left_arm_angle = -arm_swing
             right_arm_angle = arm_swing
         else:
@@ -276,78 +343,68 @@ class Character:
         arm_length = 25
         
         # Left arm with gradient
-        left_arm_end_x = center_x - 15 + int(math.sin(math.radians(left_arm_angle)) * arm_length)
-        left_arm_end_y = shoulder_y + int(math.cos(math.radians(left_arm_angle)) * arm_length)
-        for i in range(self.body_thickness):
-            offset = i - self.body_thickness // 2
-            pygame.draw.line(screen, self.color, (center_x - 5, shoulder_y), (left_arm_end_x, left_arm_end_y), 1)
+        left_arm_end_x = center_x - 15 + int(math.sin(left_arm_angle * _DEG_TO_RAD) * arm_length)
+        left_arm_end_y = shoulder_y + int(math.cos(left_arm_angle * _DEG_TO_RAD) * arm_length)
+        pygame.draw.line(screen, self.color, (center_x - 5, shoulder_y), (left_arm_end_x, left_arm_end_y), 1)
         # Add sparkle at hand
-        pygame.draw.circle(screen, color_light, (left_arm_end_x, left_arm_end_y), 5)
-        pygame.draw.circle(screen, self.color, (left_arm_end_x, left_arm_end_y), 4)
+        screen.blit(self._hand_sprite, (left_arm_end_x - 6, left_arm_end_y - 6))
         
         # Right arm with gradient
-        right_arm_end_x = center_x + 15 + int(math.sin(math.radians(right_arm_angle)) * arm_length)
-        right_arm_end_y = shoulder_y + int(math.cos(math.radians(right_arm_angle)) * arm_length)
-        for i in range(self.body_thickness):
-            offset = i - self.body_thickness // 2
-            pygame.draw.line(screen, self.color, (center_x + 5, shoulder_y), (right_arm_end_x, right_arm_end_y), 1)
+        right_arm_end_x = center_x + 15 + int(math.sin(right_arm_angle * _DEG_TO_RAD) * arm_length)
+        right_arm_end_y = shoulder_y + int(math.cos(right_arm_angle * _DEG_TO_RAD) * arm_length)
+        pygame.draw.line(screen, self.color, (center_x + 5, shoulder_y), (right_arm_end_x, right_arm_end_y), 1)
         # Add sparkle at hand
-        pygame.draw.circle(screen, color_light, (right_arm_end_x, right_arm_end_y), 5)
-        pygame.draw.circle(screen, self.color, (right_arm_end_x, right_arm_end_y), 4)
+        screen.blit(self._hand_sprite, (right_arm_end_x - 6, right_arm_end_y - 6))
         
         # Animated legs
         if self.is_walking:
             # Legs alternate with walking cycle
-            left_leg_angle = math.sin(walk_cycle) * 30
-            right_leg_angle = -math.sin(walk_cycle) * 30
+            left_leg_angle = swing * 30
+            right_leg_angle = -swing * 30
+            knee_bend = math.sin(walk_cycle + math.pi/4) * 20
         else:
             left_leg_angle = 0
             right_leg_angle = 0
         
         leg_length = 35
+        upper_leg_length = leg_length * 0.6
+        lower_leg_length = leg_length * 0.5
         
         # Left leg (upper) with gradient
-        left_knee_x = center_x - 8 + int(math.sin(math.radians(left_leg_angle)) * (leg_length * 0.6))
-        left_knee_y = hip_y + int(math.cos(math.radians(left_leg_angle)) * (leg_length * 0.6))
-        for i in range(self.body_thickness):
-            pygame.draw.line(screen, self.color, (center_x - 5, hip_y), (left_knee_x, left_knee_y), 1)
+        left_knee_x = center_x - 8 + int(math.sin(left_leg_angle * _DEG_TO_RAD) * upper_leg_length)
+        left_knee_y = hip_y + int(math.cos(left_leg_angle * _DEG_TO_RAD) * upper_leg_length)
         
         # Left leg (lower)
         if self.is_walking:
-            lower_left_angle = left_leg_angle + math.sin(walk_cycle + math.pi/4) * 20
+            lower_left_angle = left_leg_angle + knee_bend
         else:
             lower_left_angle = left_leg_angle
-        left_foot_x = left_knee_x + int(math.sin(math.radians(lower_left_angle)) * (leg_length * 0.5))
-        left_foot_y = left_knee_y + int(math.cos(math.radians(lower_left_angle)) * (leg_length * 0.5))
-        for i in range(self.body_thickness):
-            pygame.draw.line(screen, self.color, (left_knee_x, left_knee_y), (left_foot_x, left_foot_y), 1)
+        left_foot_x = left_knee_x + int(math.sin(lower_left_angle * _DEG_TO_RAD) * lower_leg_length)
+        left_foot_y = left_knee_y + int(math.cos(lower_left_angle * _DEG_TO_RAD) * lower_leg_length)
+        # Hip, knee and foot as one polyline
+        pygame.draw.lines(screen, self.color, False,
+                          [(center_x - 5, hip_y), (left_knee_x, left_knee_y), (left_foot_x, left_foot_y)], 1)
         
         # Right leg (upper) with gradient
-        right_knee_x = center_x + 8 + int(math.sin(math.radians(right_leg_angle)) * (leg_length * 0.6))
-        right_knee_y = hip_y + int(math.cos(math.radians(right_leg_angle)) * (leg_length * 0.6))
-        for i in range(self.body_thickness):
-            pygame.draw.line(screen, self.color, (center_x + 5, hip_y), (right_knee_x, right_knee_y), 1)
+        right_knee_x = center_x + 8 + int(math.sin(right_leg_angle * _DEG_TO_RAD) * upper_leg_length)
+        right_knee_y = hip_y + int(math.cos(right_leg_angle * _DEG_TO_RAD) * upper_leg_length)
         
         # Right leg (lower)
         if self.is_walking:
-            lower_right_angle = right_leg_angle + math.sin(walk_cycle + math.pi/4) * 20
+            lower_right_angle = right_leg_angle + knee_bend
         else:
             lower_right_angle = right_leg_angle
-        right_foot_x = right_knee_x + int(math.sin(math.radians(lower_right_angle)) * (leg_length * 0.5))
-        right_foot_y = right_knee_y + int(math.cos(math.radians(lower_right_angle)) * (leg_length * 0.5))
-        for i in range(self.body_thickness):
-            pygame.draw.line(screen, self.color, (right_knee_x, right_knee_y), (right_foot_x, right_foot_y), 1)
+        right_foot_x = right_knee_x + int(math.sin(lower_right_angle * _DEG_TO_RAD) * lower_leg_length)
+        right_foot_y = right_knee_y + int(math.cos(lower_right_angle * _DEG_TO_RAD) * lower_leg_length)
+        pygame.draw.lines(screen, self.color, False,
+                          [(center_x + 5, hip_y), (right_knee_x, right_knee_y), (right_foot_x, right_foot_y)], 1)
         
         # Draw stylized feet with glow
         for foot_pos in [(left_foot_x, left_foot_y), (right_foot_x, right_foot_y)]:
             # Glow
-            glow_surf = pygame.Surface((16, 16), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (*self.color, 60), (8, 8), 7)
-            screen.blit(glow_surf, (foot_pos[0] - 8, foot_pos[1] - 8))
+            screen.blit(self._foot_glow, (foot_pos[0] - 8, foot_pos[1] - 8))
             # Foot
-            pygame.draw.circle(screen, color_light, foot_pos, 5)
-            pygame.draw.circle(screen, self.color, foot_pos, 4)
-            pygame.draw.circle(screen, color_dark, foot_pos, 2)
+            screen.blit(self._foot_sprite, (foot_pos[0] - 6, foot_pos[1] - 6))
         
 
     def move(self) -> None:
@@ -39,13 +39,14 @@ WALKING_SOUND_INTERVAL = 300
 COLLISION_LOOP_SOUND_INTERVAL = 200
 
 # Apple Floodgate authentication
-APPLE_CONNECT_COMMAND = (
-    '/usr/local/bin/appleconnect getToken '
-    '-C hvys3fcwcteqrvw3qzkvtk86viuoqv '
-    '--token-type=oauth '
-    '--interactivity-type=none '
-    '-E prod '
-    '-G pkce '
-    '-o openid,dsid,accountname,profile,groups'
-)
+APPLE_CONNECT_COMMAND = [
+    '/usr/local/bin/appleconnect', 'getToken',
+    '-C', 'hvys3fcwcteqrvw3qzkvtk86viuoqv',
+    '--token-type=oauth',
+    '--interactivity-type=none',
+    '-E', 'prod',
+    '-G', 'pkce',
+    '-o', 'openid,dsid,accountname,profile,groups',
+]
+APPLE_CONNECT_TIMEOUT = 10  # seconds
 FLOODGATE_BASE_URL = 'https://floodgate.g.apple.com/api/openai/v1'
\ No newline at end of file